@@ -92,6 +92,9 @@ COLOR_BOX = "#454545"            # Dark gray - info boxes
 # Background color for airline logos (RGBA)
 # Match your display background for seamless logo cards
 LOGO_BG_COLOR = (186, 186, 186, 255)
+# Cheaper resize for newly downloaded logos (box downscale, no sharpening, 64-colour PNG).
+# Useful on slow hosts such as a Pi Zero; cached logos are unaffected.
+LOGO_FAST_RESIZE = False
 
 # =============================================================================
 # Logging
@@ -3,16 +3,14 @@
 import argparse
 import logging
 import os
-import subprocess
 import sys
+from functools import lru_cache
 from logging.handlers import TimedRotatingFileHandler
 
-from pixoo_radar.controller import PixooRadarController
-from pixoo_radar.models import FlightSnapshot, WeatherSnapshot
-from pixoo_radar.services.weather_service import WeatherService
-from pixoo_radar.settings import load_settings
-
 LOGGER = logging.getLogger("pixoo_radar")
+# Set in the environment of the caffeinate child so it does not re-exec again.
+CAFFEINATED_ENV_VAR = "PIXOO_CAFFEINATED"
+_SELF_PATH = os.path.abspath(__file__)
 
 
 def configure_logging(level_name: str, verbose_events: bool) -> None:
@@ -51,6 +49,71 @@ def configure_logging(level_name: str, verbose_events: bool) -> None:
         root_logger.warning("File logging disabled; cannot initialize '%s': %s", log_file, exc)
 
 
+def hold_idle_sleep_assertion(reason: str = "Pixoo Radar") -> bool:
+    """
+    Keep macOS awake for the lifetime of this process via an IOKit power assertion.
+
+    Equivalent to `caffeinate -i` without re-running the tracker in a child
+    interpreter. The assertion is released by the OS when the process exits.
+    Returns False when unavailable so the caller can fall back to caffeinate.
+    """
+    if sys.platform != "darwin":
+        return False
+    try:
+        import ctypes
+
+        core_foundation = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+        iokit = ctypes.CDLL("/System/Library/Frameworks/IOKit.framework/IOKit")
+        cf_string = core_foundation.CFStringCreateWithCString
+        cf_string.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf_string.restype = ctypes.c_void_p
+        create_assertion = iokit.IOPMAssertionCreateWithName
+        create_assertion.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+        create_assertion.restype = ctypes.c_int32
+
+        utf8 = 0x08000100  # kCFStringEncodingUTF8
+        assertion_on = 255  # kIOPMAssertionLevelOn
+        assertion_id = ctypes.c_uint32()
+        result = create_assertion(
+            cf_string(None, b"PreventUserIdleSystemSleep", utf8),
+            assertion_on,
+            cf_string(None, reason.encode("utf-8"), utf8),
+            ctypes.byref(assertion_id),
+        )
+    except (OSError, AttributeError) as exc:
+        LOGGER.warning("IOKit sleep assertion unavailable: %s", exc)
+        return False
+    if result != 0:
+        LOGGER.warning("IOKit sleep assertion failed (IOReturn 0x%08x).", result & 0xFFFFFFFF)
+        return False
+    return True
+
+
+def reexec_under_caffeinate() -> None:
+    """Replace this process with `caffeinate -i` running the same command line."""
+    os.environ[CAFFEINATED_ENV_VAR] = "1"
+    child_cmd = [sys.executable, _SELF_PATH, *sys.argv[1:]]
+    try:
+        os.execvp("caffeinate", ["caffeinate", "-i", *child_cmd])
+    except OSError as exc:
+        os.environ.pop(CAFFEINATED_ENV_VAR, None)
+        LOGGER.warning("Unable to run under caffeinate (%s); continuing without sleep prevention.", exc)
+
+
+_DEMO_FLIGHT_STATIC = {
+    "icao24": "TEST123",
+    "callsign": "GAF001",
+    "flight_number": "GAF001",
+    "origin": "ETAR",
+    "destination": "LCPH",
+    "airline": "Germany - Air Force",
+    "registration": "10+01",
+    "aircraft_type": "Airbus A320",
+    "aircraft_type_icao": "A320",
+    "status": "EN ROUTE",
+}
+
+
 class DemoFlightService:
     """Synthetic flight source for local rendering tests."""
 
@@ -58,25 +121,13 @@ class DemoFlightService:
         self._tick = 0
 
     def get_closest_flight(self, latitude: float, longitude: float):
+        from pixoo_radar.models import FlightSnapshot
+
         self._tick += 1
         speed = 220 + ((self._tick % 8) * 7)
         altitude = min(39000, 1200 + (self._tick * 850))
         heading = (95 + (self._tick * 3)) % 360
-        payload = {
-            "icao24": "TEST123",
-            "callsign": "GAF001",
-            "flight_number": "GAF001",
-            "origin": "ETAR",
-            "destination": "LCPH",
-            "airline": "Germany - Air Force",
-            "registration": "10+01",
-            "aircraft_type": "Airbus A320",
-            "aircraft_type_icao": "A320",
-            "altitude": altitude,
-            "ground_speed": speed,
-            "heading": heading,
-            "status": "EN ROUTE",
-        }
+        payload = {**_DEMO_FLIGHT_STATIC, "altitude": altitude, "ground_speed": speed, "heading": heading}
         return FlightSnapshot.from_dict(payload)
 
 
@@ -84,7 +135,10 @@ class DemoWeatherService:
     """Stub weather service used only when forcing test-flight mode."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _snapshot():
+        from pixoo_radar.models import WeatherSnapshot
+
         return WeatherSnapshot.from_dict(
             {
                 "temperature_c": 20,
@@ -114,12 +168,6 @@ class DemoWeatherService:
 
 
 def main() -> None:
-    try:
-        settings = load_settings()
-    except ValueError as exc:
-        print(str(exc), file=sys.stderr)
-        sys.exit(2)
-
     parser = argparse.ArgumentParser(description="Pixoo Flight Tracker Display")
     parser.add_argument("--caffeinate", action="store_true", help="Prevent macOS from sleeping while tracker runs")
     parser.add_argument(
@@ -129,13 +177,32 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Settle sleep prevention before any settings/weather work so a caffeinate re-exec does it only once.
+    sleep_prevented = False
+    if args.caffeinate:
+        sleep_prevented = os.environ.get(CAFFEINATED_ENV_VAR) == "1" or hold_idle_sleep_assertion()
+        if not sleep_prevented:
+            reexec_under_caffeinate()
+
+    from pixoo_radar.settings import load_settings
+
+    try:
+        settings = load_settings()
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        sys.exit(2)
+
     configure_logging(settings.log_level, settings.log_verbose_events)
     LOGGER.info("Starting Pixoo Radar.")
+    if sleep_prevented:
+        LOGGER.info("macOS idle sleep prevented while the tracker runs.")
     if args.test_flight:
         LOGGER.warning("Test-flight mode enabled: using synthetic flight payloads.")
         weather_service = DemoWeatherService()
         flight_service = DemoFlightService()
     else:
+        from pixoo_radar.services.weather_service import WeatherService
+
         weather_service = WeatherService(
             latitude=settings.latitude,
             longitude=settings.longitude,
@@ -143,19 +210,18 @@ def main() -> None:
             metar_icao=settings.weather_metar_icao,
         )
         try:
-            weather_service.validate_startup_sources(require_metar=bool(settings.weather_metar_icao))
-            LOGGER.info("Weather startup validation passed.")
-            LOGGER.info("Weather updated from API (startup prefetch).")
+            startup_source = weather_service.validate_startup_sources(require_metar=settings.requires_metar)
+            if startup_source == "snapshot":
+                LOGGER.info("Weather served from saved snapshot at startup; refreshing when it ages out.")
+            else:
+                LOGGER.info("Weather startup validation passed.")
+                LOGGER.info("Weather updated from API (startup prefetch).")
         except Exception as exc:
             LOGGER.error("Weather startup validation failed: %s", exc)
             sys.exit(2)
         flight_service = None
 
-    if args.caffeinate:
-        child_cmd = [sys.executable, os.path.abspath(__file__)]
-        if args.test_flight:
-            child_cmd.append("--test-flight")
-        sys.exit(subprocess.call(["caffeinate", "-i", *child_cmd]))
+    from pixoo_radar.controller import PixooRadarController
 
     try:
         PixooRadarController(settings, weather_service=weather_service, flight_service=flight_service).run()
@@ -7,33 +7,75 @@ provider/filter/logo/METAR modules.
 
 import json
 import logging
+from time import monotonic
+from typing import Any
 
 from config import FLIGHT_SEARCH_RADIUS_METERS, LOGO_BG_COLOR, RUNWAY_HEADING_DEG
-from pixoo_radar.flight.filters import choose_closest_flight
+from pixoo_radar.flight.filters import rank_closest_flights
 from pixoo_radar.flight.logos import LogoManager
 from pixoo_radar.flight.mapping import build_flight_payload
 from pixoo_radar.flight.provider import FlightRadarProvider
 
 LOGGER = logging.getLogger("pixoo_radar.flight")
+# An empty search area is not re-queried within this window; longer quiet periods are backed off by the controller.
+EMPTY_AREA_CACHE_SECONDS = 5.0
+LOGO_CACHE_SIZE = 64
+# Flight details (airline, route, aircraft) barely change during one overhead pass.
+DETAILS_CACHE_TTL_SECONDS = 60.0
+# Serve early re-polls (e.g. after a reconnect) from the last search; kept well below any poll interval.
+FLIGHTS_CACHE_TTL_SECONDS = 5.0
+# Next-nearest candidates whose details are fetched alongside the closest one, ready for when they take over.
+DETAILS_PREFETCH_COUNT = 2
 
 
-def _loggable(value, depth: int = 0):
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _loggable(value, depth: int = 0, _seen: dict | None = None):
     if depth > 6:
         return "<max-depth>"
-    if isinstance(value, dict):
-        return {key: _loggable(val, depth + 1) for key, val in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [_loggable(item, depth + 1) for item in value]
-    if isinstance(value, (str, int, float, bool)) or value is None:
+    if type(value) in _SCALAR_TYPES:
         return value
-    if hasattr(value, "__dict__"):
-        return {key: _loggable(val, depth + 1) for key, val in vars(value).items()}
-    return repr(value)
-
-
-def _to_log_json(value) -> str:
+    # FR24 payloads reuse airport/airline objects; convert each (object, depth) pair once.
+    if _seen is None:
+        _seen = {}
+    memo_key = (id(value), depth)
+    if memo_key in _seen:
+        return _seen[memo_key][1]
+    result: Any
+    if isinstance(value, dict):
+        result = {key: _loggable(val, depth + 1, _seen) for key, val in value.items()}
+    elif isinstance(value, (list, tuple, set)):
+        result = [_loggable(item, depth + 1, _seen) for item in value]
+    elif isinstance(value, (str, int, float, bool)) or value is None:
+        result = value
+    elif hasattr(value, "__dict__"):
+        result = {key: _loggable(val, depth + 1, _seen) for key, val in vars(value).items()}
+    else:
+        result = repr(value)
+    # Keep the source object alive so its id cannot be reused while the memo is shared.
+    _seen[memo_key] = (value, result)
+    return result
+
+
+def _debug_output_enabled() -> bool:
+    """True when a DEBUG record from LOGGER would reach at least one handler."""
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return False
+    logger: logging.Logger | None = LOGGER
+    while logger is not None:
+        if any(handler.level <= logging.DEBUG for handler in logger.handlers):
+            return True
+        if not logger.propagate:
+            break
+        logger = logger.parent
+    return False
+
+
+def _to_log_json(value, memo: dict | None = None) -> str:
+    """Serialize for debug logs; pass the same `memo` to reuse conversions across related dumps."""
     try:
-        return json.dumps(_loggable(value), sort_keys=True)
+        return json.dumps(_loggable(value, _seen=memo), separators=(",", ":"))
     except Exception:
         return repr(value)
 
@@ -47,29 +89,72 @@ class FlightData:
         fr_api=None,
         provider=None,
         logo_manager: LogoManager | None = None,
+        session=None,
+        clock_fn=None,
+        logo_fast_resize: bool = False,
     ):
-        self.provider = provider or FlightRadarProvider(fr_api=fr_api, search_radius_meters=FLIGHT_SEARCH_RADIUS_METERS)
-        self.logo_manager = logo_manager or LogoManager(save_logo_dir=save_logo_dir, bg_color=LOGO_BG_COLOR)
+        # Provider client and logo cache are built on first use, not at startup.
+        self._provider = provider
+        self._logo_manager = logo_manager
+        self._fr_api = fr_api
+        self._session = session
+        self._save_logo_dir = save_logo_dir
+        self._logo_fast_resize = logo_fast_resize
+        self._clock_fn = clock_fn or monotonic
+        self._empty_area_until = 0.0
+        self._logo_cache: dict[tuple[str, str], str] = {}
+        self._details_cache: dict[str, tuple[float, dict]] = {}
+
+    @property
+    def provider(self):
+        if self._provider is None:
+            self._provider = FlightRadarProvider(
+                fr_api=self._fr_api,
+                search_radius_meters=FLIGHT_SEARCH_RADIUS_METERS,
+                session=self._session,
+                flights_cache_ttl_seconds=FLIGHTS_CACHE_TTL_SECONDS,
+                clock_fn=self._clock_fn,
+            )
+        return self._provider
+
+    @property
+    def logo_manager(self) -> LogoManager:
+        if self._logo_manager is None:
+            self._logo_manager = LogoManager(
+                save_logo_dir=self._save_logo_dir,
+                bg_color=LOGO_BG_COLOR,
+                fast_resize=self._logo_fast_resize,
+            )
+        return self._logo_manager
 
     def _find_closest(self, lat, lon):
+        if self._clock_fn() < self._empty_area_until:
+            LOGGER.info("Search area was empty moments ago; skipping flight API call.")
+            return None, None
+
+        # Built outside the try: a missing FR24 client must surface, not read as an empty search.
+        provider = self.provider
         try:
-            flights = self.provider.get_flights_near(lat, lon)
+            flights = provider.get_flights_near(lat, lon)
         except Exception as exc:
             LOGGER.warning("Flight fetch failed: %s", exc)
             return None, None
 
         if not flights:
             LOGGER.info("Flight API returned no candidates in search area.")
+            self._empty_area_until = self._clock_fn() + EMPTY_AREA_CACHE_SECONDS
             return None, None
 
-        closest_flight, filter_stats = choose_closest_flight(
+        ranked, filter_stats = rank_closest_flights(
             flights,
             lat,
             lon,
             runway_heading_deg=RUNWAY_HEADING_DEG,
-            return_stats=True,
+            limit=1 + DETAILS_PREFETCH_COUNT,
         )
-        if LOGGER.isEnabledFor(logging.DEBUG):
+        closest_flight = ranked[0] if ranked else None
+        debug_output = _debug_output_enabled()
+        if debug_output:
             LOGGER.debug("Flight candidate filter stats: %s", filter_stats)
         if not closest_flight:
             LOGGER.info(
@@ -85,16 +170,68 @@ class FlightData:
             )
             return None, None
 
-        if LOGGER.isEnabledFor(logging.DEBUG):
-            LOGGER.debug("Flight API selected flight raw: %s", _to_log_json(closest_flight))
+        log_memo = {} if debug_output else None
+        if log_memo is not None:
+            LOGGER.debug("Flight API selected flight raw: %s", _to_log_json(closest_flight, log_memo))
+        now = self._clock_fn()
+        cached = self._cached_details(closest_flight, now)
+        if cached is not None:
+            return closest_flight, cached
+
+        # Fetch the closest flight's details together with uncached runners-up (wall time ~ one round-trip).
+        to_fetch = [closest_flight] + [flight for flight in ranked[1:] if self._cached_details(flight, now) is None]
+        futures = self.provider.get_flight_details_many(to_fetch)
+        for flight, future in zip(to_fetch[1:], futures[1:], strict=True):
+            try:
+                self._store_details(flight, future.result(), now)
+            except Exception as exc:
+                LOGGER.debug("Flight details prefetch failed for %s: %s", getattr(flight, "icao", "unknown"), exc)
         try:
-            details = self.provider.get_flight_details(closest_flight)
-            if LOGGER.isEnabledFor(logging.DEBUG):
-                LOGGER.debug("Flight API details raw: %s", _to_log_json(details))
-            return closest_flight, details
+            details = futures[0].result()
+            if log_memo is not None:
+                LOGGER.debug("Flight API details raw: %s", _to_log_json(details, log_memo))
         except Exception as exc:
             LOGGER.warning("Flight details fetch failed for %s: %s", getattr(closest_flight, "icao", "unknown"), exc)
             return closest_flight, None
+        self._store_details(closest_flight, details, now)
+        return closest_flight, details
+
+    @staticmethod
+    def _details_key(flight):
+        return getattr(flight, "id", None) or getattr(flight, "icao", None)
+
+    def _cached_details(self, flight, now: float):
+        cached = self._details_cache.get(self._details_key(flight))
+        if cached and now - cached[0] < DETAILS_CACHE_TTL_SECONDS:
+            return cached[1]
+        return None
+
+    def _store_details(self, flight, details: dict | None, now: float) -> None:
+        """Cache a flight's details, dropping entries that have outlived the TTL."""
+        details_key = self._details_key(flight)
+        if not details_key or not details:
+            return
+        for key, (fetched_at, _) in list(self._details_cache.items()):
+            if now - fetched_at >= DETAILS_CACHE_TTL_SECONDS:
+                del self._details_cache[key]
+        self._details_cache[details_key] = (now, details)
+
+    def _resolve_logo(self, airline_iata, airline_icao):
+        """Resolve an airline logo once per (IATA, ICAO); misses are left to the logo manager's TTL."""
+        cache_key = (airline_iata or "", airline_icao or "")
+        if cache_key in self._logo_cache:
+            return self._logo_cache[cache_key]
+        logo_path = self.logo_manager.resolve_or_fetch_logo(
+            provider=self.provider,
+            airline_iata=airline_iata,
+            airline_icao=airline_icao,
+        )
+        if logo_path is None:
+            return None
+        if len(self._logo_cache) >= LOGO_CACHE_SIZE:
+            self._logo_cache.pop(next(iter(self._logo_cache)))
+        self._logo_cache[cache_key] = logo_path
+        return logo_path
 
     def get_closest_flight_data(self, lat, lon, save_logo: bool = True):
         """Return closest-flight payload dict or None."""
@@ -106,11 +243,7 @@ class FlightData:
 
         if save_logo and self.logo_manager:
             try:
-                logo_path = self.logo_manager.resolve_or_fetch_logo(
-                    provider=self.provider,
-                    airline_iata=flight_data.get("airline_iata"),
-                    airline_icao=flight_data.get("airline_icao"),
-                )
+                logo_path = self._resolve_logo(flight_data.get("airline_iata"), flight_data.get("airline_icao"))
                 if logo_path:
                     flight_data["airline_logo_path"] = logo_path
             except Exception:
@@ -1,13 +1,17 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time as local_time
 from time import monotonic, sleep
 
-from pixoo_radar.models import RenderState
+from pixoo_radar.models import FlightSnapshot, RenderState
 from pixoo_radar.render.flight_view import build_and_send_animation
 from pixoo_radar.render.holding_view import build_and_send_poll_pause_screen
 from pixoo_radar.render.weather_view import build_and_send_weather_idle_screen
 
 LOGGER = logging.getLogger("pixoo_radar")
+# With no flight in range (or a failed search), each further poll doubles the wait, up to this multiple of the base
+# interval. This is the app's only polling backoff.
+IDLE_POLL_MAX_FACTOR = 5
 
 
 class PixooRadarController:
@@ -28,7 +32,10 @@ class PixooRadarController:
             pixoo_service = PixooClient(settings)
         if flight_service is None:
             from pixoo_radar.services.flight_service import FlightService
-            flight_service = FlightService(logo_dir=settings.logo_dir)
+            flight_service = FlightService(
+                logo_dir=settings.logo_dir,
+                logo_fast_resize=settings.logo_fast_resize,
+            )
         if weather_service is None:
             from pixoo_radar.services.weather_service import WeatherService
             weather_service = WeatherService(
@@ -45,6 +52,10 @@ class PixooRadarController:
         self.current_state = None
         self.current_flight_id = None
         self.current_flight_signature = None
+        self.current_flight_label = None
+        self.current_weather_payload = None
+        self.idle_misses = 0
+        self._stop_requested = False
         self.sleep_fn = sleep_fn or sleep
         self.clock_fn = clock_fn or monotonic
         self.local_time_fn = local_time_fn or (lambda: datetime.now().time())
@@ -52,6 +63,8 @@ class PixooRadarController:
         self.poll_pause_start_time = self._parse_hhmm_time(getattr(settings, "poll_pause_start_local", ""))
         self.poll_pause_end_time = self._parse_hhmm_time(getattr(settings, "poll_pause_end_local", ""))
         self.poll_pause_notice_sent = False
+        # Once the display is known to be reachable, the flight fetch and a due weather refresh run side by side.
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pixoo-radar-io")
         if self.poll_pause_start_time and self.poll_pause_end_time:
             LOGGER.info(
                 "Polling pause window configured: %s-%s local.",
@@ -63,13 +76,7 @@ class PixooRadarController:
 
     @staticmethod
     def flight_render_signature(data: dict) -> tuple:
-        return (
-            data.get("icao24"),
-            int(round(float(data.get("altitude") or 0))),
-            int(round(float(data.get("ground_speed") or 0))),
-            int(round(float(data.get("heading") or 0))),
-            str(data.get("status") or ""),
-        )
+        return FlightSnapshot.from_dict(data).render_signature
 
     def poll_flight(self):
         return self.flight_service.get_closest_flight(self.settings.latitude, self.settings.longitude)
@@ -78,6 +85,9 @@ class PixooRadarController:
         self.current_state = None
         self.current_flight_id = None
         self.current_flight_signature = None
+        self.current_flight_label = None
+        self.current_weather_payload = None
+        self.idle_misses = 0
         self.poll_pause_notice_sent = False
 
     @staticmethod
@@ -124,9 +134,22 @@ class PixooRadarController:
         self.pizzoo = self.pixoo_service.connect_with_retry(fail_fast=fail_fast)
         self.reset_tracking()
 
-    def handle_state_transition(self, target_state):
+    def send_weather_screen(self, payload: dict) -> None:
+        if payload == self.current_weather_payload:
+            LOGGER.info("Weather payload unchanged; idle screen already shown (skipping resend).")
+            return
+        build_and_send_weather_idle_screen(self.pizzoo, self.settings, payload)
+        self.current_weather_payload = dict(payload)
+
+    def _forget_displayed_views(self) -> None:
+        """The device is about to show another screen, so the next flight/weather view must be resent."""
         self.current_flight_id = None
         self.current_flight_signature = None
+        self.current_flight_label = None
+        self.current_weather_payload = None
+
+    def handle_state_transition(self, target_state):
+        self._forget_displayed_views()
         force_refresh = self.current_state == RenderState.FLIGHT_ACTIVE
         weather_snapshot, refreshed = self.weather_service.get_current_with_options(force_refresh=force_refresh)
         if refreshed:
@@ -142,19 +165,22 @@ class PixooRadarController:
                 self.settings.weather_refresh_seconds,
                 next_update_seconds,
             )
-        build_and_send_weather_idle_screen(self.pizzoo, self.settings, weather_snapshot.payload)
+        self.send_weather_screen(weather_snapshot.payload)
         self.current_state = target_state
 
-    def handle_same_state_tick(self, target_state):
+    def handle_same_state_tick(self, target_state, weather_future=None):
         if target_state == RenderState.IDLE_WEATHER:
-            weather_snapshot, refreshed = self.weather_service.get_current()
+            if weather_future is not None:
+                weather_snapshot, refreshed = weather_future.result()
+            else:
+                weather_snapshot, refreshed = self.weather_service.get_current()
             if refreshed:
                 weather_error = self.weather_service.get_last_error()
                 if weather_error:
                     LOGGER.warning("Weather refresh failed (%s); using cached weather data.", weather_error)
                 else:
                     LOGGER.info("Weather updated from API (%s).", weather_snapshot.source or "unknown source")
-                build_and_send_weather_idle_screen(self.pizzoo, self.settings, weather_snapshot.payload)
+                self.send_weather_screen(weather_snapshot.payload)
             else:
                 next_update_seconds = self._weather_seconds_until_refresh()
                 LOGGER.info(
@@ -178,6 +204,8 @@ class PixooRadarController:
                     end_local,
                     now_local,
                 )
+                self._forget_displayed_views()
+                self.current_state = None
                 try:
                     build_and_send_poll_pause_screen(
                         self.pizzoo,
@@ -200,7 +228,7 @@ class PixooRadarController:
                 now_local,
                 self.settings.data_refresh_seconds,
             )
-            self.sleep_fn(self.settings.data_refresh_seconds)
+            self._sleep_until_next_cycle(self.settings.data_refresh_seconds)
             return
         if self.poll_pause_notice_sent:
             LOGGER.info("Polling pause window ended; resuming normal polling.")
@@ -211,24 +239,37 @@ class PixooRadarController:
             return
 
         LOGGER.info("Fetching closest flight data.")
-        flight_snapshot = self.poll_flight()
+        flight_future = self._io_executor.submit(self.poll_flight)
+        weather_future = None
+        if self.current_state == RenderState.IDLE_WEATHER and self._weather_seconds_until_refresh() == 0:
+            # Likely to stay idle: refresh weather while the flight search is in flight.
+            weather_future = self._io_executor.submit(self.weather_service.get_current)
+        try:
+            flight_snapshot = flight_future.result()
+        except Exception:
+            self._discard_weather_refresh(weather_future)
+            raise
 
         if flight_snapshot:
+            self._discard_weather_refresh(weather_future)
+            self.idle_misses = 0
             self.current_state = RenderState.FLIGHT_ACTIVE
             data = flight_snapshot.payload
             new_flight_id = data.get("icao24")
-            new_signature = self.flight_render_signature(data)
+            new_signature = flight_snapshot.render_signature
             if new_flight_id == self.current_flight_id and new_signature == self.current_flight_signature:
-                LOGGER.info("Still tracking %s; telemetry unchanged.", data.get("flight_number"))
-                self.sleep_fn(self.settings.data_refresh_seconds)
+                LOGGER.info("Still tracking %s; telemetry unchanged.", self.current_flight_label)
+                self._sleep_until_next_cycle(self.settings.data_refresh_seconds)
                 return
 
+            # Label refreshed only on telemetry changes; unchanged ticks reuse it.
+            self.current_flight_label = data.get("flight_number")
             if new_flight_id == self.current_flight_id:
-                LOGGER.info("Still tracking %s; telemetry changed, updating animation.", data.get("flight_number"))
-            else:
+                LOGGER.info("Still tracking %s; telemetry changed, updating animation.", self.current_flight_label)
+            elif LOGGER.isEnabledFor(logging.INFO):
                 LOGGER.info(
                     "New flight: %s (%s -> %s).",
-                    data.get("flight_number"),
+                    self.current_flight_label,
                     data.get("origin"),
                     data.get("destination"),
                 )
@@ -243,7 +284,7 @@ class PixooRadarController:
                 self.reconnect()
                 return
             LOGGER.info("Animation playing. Next check in %ss.", self.settings.data_refresh_seconds)
-            self.sleep_fn(self.settings.data_refresh_seconds)
+            self._sleep_until_next_cycle(self.settings.data_refresh_seconds)
             return
 
         target_state = RenderState.IDLE_WEATHER
@@ -260,7 +301,7 @@ class PixooRadarController:
                 return
         else:
             try:
-                self.handle_same_state_tick(target_state)
+                self.handle_same_state_tick(target_state, weather_future=weather_future)
             except Exception as exc:
                 if self._is_fatal_weather_error(exc):
                     LOGGER.error("Fatal weather error: %s", exc)
@@ -269,10 +310,36 @@ class PixooRadarController:
                 self.reconnect()
                 return
 
-        LOGGER.info("No flight data available, next poll in %ss.", self.settings.data_refresh_seconds)
-        self.sleep_fn(self.settings.data_refresh_seconds)
+        idle_seconds = self.settings.data_refresh_seconds * min(2**self.idle_misses, IDLE_POLL_MAX_FACTOR)
+        if 2**self.idle_misses < IDLE_POLL_MAX_FACTOR:
+            self.idle_misses += 1
+        LOGGER.info("No flight data available, next poll in %ss.", idle_seconds)
+        self._sleep_until_next_cycle(idle_seconds)
+
+    @staticmethod
+    def _discard_weather_refresh(weather_future) -> None:
+        """Let a speculative weather refresh finish in the background without blocking; only its error is logged."""
+        if weather_future is not None:
+            weather_future.add_done_callback(PixooRadarController._log_weather_refresh_error)
+
+    @staticmethod
+    def _log_weather_refresh_error(weather_future) -> None:
+        exc = weather_future.exception()
+        if exc is not None:
+            LOGGER.warning("Background weather refresh failed (%s); will retry when idle.", exc)
+
+    def _sleep_until_next_cycle(self, interval: float) -> None:
+        """Sleep until `interval` after this cycle started, so fetch/render time does not stretch the cadence."""
+        self.sleep_fn(max(0.0, interval - (self.clock_fn() - self.last_cycle_started_at)))
+
+    def stop(self) -> None:
+        """Ask `run()` to return after the current cycle; the I/O pool is shut down once it has."""
+        self._stop_requested = True
 
     def run(self):
-        self.reconnect(fail_fast=True)
-        while True:
-            self.run_once()
+        try:
+            self.reconnect(fail_fast=True)
+            while not self._stop_requested:
+                self.run_once()
+        finally:
+            self._io_executor.shutdown(wait=True)
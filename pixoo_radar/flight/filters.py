@@ -2,6 +2,12 @@
 
 from math import asin, cos, isfinite, radians, sin, sqrt
 
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+# Provider telemetry is normally already int/float; only other types go through `_to_float`.
+_NUMERIC_TYPES = (int, float)
+
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate great-circle distance in kilometers."""
@@ -10,7 +16,22 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     dlat = lat2 - lat1
     a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
     c = 2 * asin(sqrt(a))
-    return c * 6371.0
+    return c * EARTH_RADIUS_KM
+
+
+def haversine_km_array(lat_rad, lon_rad, lats_rad, lons_rad) -> np.ndarray:
+    """
+    Great-circle distances (km) between radian coordinates, with NumPy broadcasting.
+
+    A scalar observer against N points gives shape `(N,)`; observers shaped
+    `(M, 1)` against N points give the pairwise `(M, N)` matrix.
+    """
+    lat_rad = np.asarray(lat_rad, dtype=float)
+    lon_rad = np.asarray(lon_rad, dtype=float)
+    lats_rad = np.asarray(lats_rad, dtype=float)
+    lons_rad = np.asarray(lons_rad, dtype=float)
+    a = np.sin((lats_rad - lat_rad) / 2) ** 2 + np.cos(lat_rad) * np.cos(lats_rad) * np.sin((lons_rad - lon_rad) / 2) ** 2
+    return 2 * np.arcsin(np.sqrt(a)) * EARTH_RADIUS_KM
 
 
 def has_airline_info(flight) -> bool:
@@ -50,6 +71,25 @@ def is_stationary_ground_target(flight) -> bool:
     return ground_speed <= 0
 
 
+def _runway_headings(runway_heading_deg: float, alignment_tolerance_deg: float):
+    """Return `(runway, tolerance)` or None when the runway heading is unusable."""
+    runway_heading = _normalize_heading_deg(runway_heading_deg)
+    if runway_heading is None:
+        return None
+    tolerance = max(0.0, _to_float(alignment_tolerance_deg, default=10.0))
+    return runway_heading, tolerance
+
+
+def _is_runway_aligned(flight, runway_headings) -> bool:
+    heading = _normalize_heading_deg(getattr(flight, "heading", None))
+    if heading is None or runway_headings is None:
+        return False
+    runway_heading, tolerance = runway_headings
+    # Folding by 180 deg measures against the runway and its reciprocal in one step.
+    offset = (heading - runway_heading) % 180.0
+    return min(offset, 180.0 - offset) <= tolerance
+
+
 def is_taxiing_ground_target(
     flight,
     runway_heading_deg: float,
@@ -66,19 +106,7 @@ def is_taxiing_ground_target(
     ground_speed = _to_float(getattr(flight, "ground_speed", 0) or 0, default=0.0)
     if ground_speed <= 0:
         return False
-
-    heading = _normalize_heading_deg(getattr(flight, "heading", None))
-    runway_heading = _normalize_heading_deg(runway_heading_deg)
-    if heading is None or runway_heading is None:
-        return True
-
-    reciprocal_heading = (runway_heading + 180.0) % 360.0
-    tolerance = max(0.0, _to_float(alignment_tolerance_deg, default=10.0))
-    aligned = (
-        heading_diff_deg(heading, runway_heading) <= tolerance
-        or heading_diff_deg(heading, reciprocal_heading) <= tolerance
-    )
-    return not aligned
+    return not _is_runway_aligned(flight, _runway_headings(runway_heading_deg, alignment_tolerance_deg))
 
 
 def choose_closest_flight(
@@ -93,8 +121,29 @@ def choose_closest_flight(
 
     If `return_stats` is True, returns `(closest_flight, stats_dict)`.
     """
-    closest_flight = None
-    min_dist = float("inf")
+    ranked, stats = rank_closest_flights(
+        flights,
+        latitude,
+        longitude,
+        runway_heading_deg=runway_heading_deg,
+        alignment_tolerance_deg=alignment_tolerance_deg,
+    )
+    closest_flight = ranked[0] if ranked else None
+    if return_stats:
+        return closest_flight, stats
+    return closest_flight
+
+
+def rank_closest_flights(
+    flights,
+    latitude: float,
+    longitude: float,
+    runway_heading_deg: float,
+    alignment_tolerance_deg: float = 10.0,
+    limit: int = 1,
+):
+    """Return `(up to limit usable flights nearest-first, stats_dict)` with the same filtering as above."""
+    ranked = []
     stats = {
         "total": 0,
         "missing_airline": 0,
@@ -104,32 +153,46 @@ def choose_closest_flight(
         "usable": 0,
         "selected_distance_km": None,
     }
+    # Runway heading/tolerance are loop-invariant; each flight's altitude and speed are read once.
+    runway_headings = _runway_headings(runway_heading_deg, alignment_tolerance_deg)
+    candidates, lats_rad, lons_rad = [], [], []
     for flight in flights:
         stats["total"] += 1
         if not has_airline_info(flight):
             stats["missing_airline"] += 1
             continue
-        if is_stationary_ground_target(flight):
-            stats["stationary_ground"] += 1
-            continue
-        if is_taxiing_ground_target(
-            flight,
-            runway_heading_deg=runway_heading_deg,
-            alignment_tolerance_deg=alignment_tolerance_deg,
-        ):
-            stats["taxiing_ground"] += 1
-            continue
+        altitude = getattr(flight, "altitude", 0) or 0
+        if type(altitude) not in _NUMERIC_TYPES:
+            altitude = _to_float(altitude, default=0.0)
+        if altitude <= 0:
+            ground_speed = getattr(flight, "ground_speed", 0) or 0
+            if type(ground_speed) not in _NUMERIC_TYPES:
+                ground_speed = _to_float(ground_speed, default=0.0)
+            if ground_speed <= 0:
+                stats["stationary_ground"] += 1
+                continue
+            if not _is_runway_aligned(flight, runway_headings):
+                stats["taxiing_ground"] += 1
+                continue
         stats["usable"] += 1
         try:
-            dist = haversine_km(latitude, longitude, flight.latitude, flight.longitude)
+            flight_lat, flight_lon = radians(flight.latitude), radians(flight.longitude)
         except Exception:
             stats["distance_error"] += 1
             continue
-        if dist < min_dist:
-            min_dist = dist
-            closest_flight = flight
-    if closest_flight is not None:
-        stats["selected_distance_km"] = min_dist
-    if return_stats:
-        return closest_flight, stats
-    return closest_flight
+        candidates.append(flight)
+        lats_rad.append(flight_lat)
+        lons_rad.append(flight_lon)
+
+    if candidates and limit > 0:
+        # One vectorized distance pass over all usable candidates; NaN positions never win.
+        distances = haversine_km_array(radians(latitude), radians(longitude), lats_rad, lons_rad)
+        distances[np.isnan(distances)] = np.inf
+        if limit == 1:
+            order = [int(np.argmin(distances))]
+        else:
+            order = np.argsort(distances, kind="stable")[:limit].tolist()
+        ranked = [candidates[index] for index in order if np.isfinite(distances[index])]
+        if ranked:
+            stats["selected_distance_km"] = float(distances[order[0]])
+    return ranked, stats
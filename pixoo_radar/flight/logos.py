@@ -1,29 +1,105 @@
 """Airline logo cache/resize utilities."""
 
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
+from time import time
+
+try:
+    from PIL import Image, ImageFilter, ImageOps
+
+    _HAVE_PIL = True
+except ImportError:
+    _HAVE_PIL = False
+
+# Resized logos with fewer distinct colours than this are treated as flat artwork.
+LOGO_FLAT_MAX_COLORS = 31
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9_-]")
+# Airlines the provider had no logo for are not asked again for this long (persisted across restarts).
+NO_LOGO_TTL_SECONDS = 24 * 60 * 60
+NO_LOGO_FILE_NAME = ".negative.json"
+# Resized logos kept under `.by_hash` for reuse across airline codes; the oldest are pruned beyond this.
+LOGO_HASH_CACHE_MAX_FILES = 256
 
 
 class LogoManager:
     """Cache and normalize airline logos for Pixoo display."""
 
-    def __init__(self, save_logo_dir: str | Path | None, bg_color=(255, 255, 255, 0)):
+    def __init__(
+        self,
+        save_logo_dir: str | Path | None,
+        bg_color=(255, 255, 255, 0),
+        clock_fn=None,
+        fast_resize: bool = False,
+    ):
         self.save_logo_dir = Path(save_logo_dir) if save_logo_dir else None
         self.bg_color = bg_color
+        # Opt-in cheaper pipeline: BOX downscale, no autocontrast/sharpening, 64-colour palette PNG.
+        self.fast_resize = bool(fast_resize)
+        self._clock_fn = clock_fn or time
+        self._no_logo_since: dict[str, float] = {}
+        # Saved logos by file stem, listed once at startup instead of a stat() per lookup.
+        self._known_logos: dict[str, Path] = {}
         if self.save_logo_dir:
             self.save_logo_dir.mkdir(parents=True, exist_ok=True)
+            self._no_logo_since = self._load_no_logo()
+            with os.scandir(self.save_logo_dir) as entries:
+                self._known_logos = {
+                    entry.name[:-4]: self.save_logo_dir / entry.name
+                    for entry in entries
+                    if entry.name.endswith(".png") and entry.is_file()
+                }
+
+    @staticmethod
+    def _no_logo_key(airline_iata: str | None, airline_icao: str | None) -> str:
+        return f"{airline_iata or ''}|{airline_icao or ''}"
+
+    def _load_no_logo(self) -> dict[str, float]:
+        if self.save_logo_dir is None:
+            return {}
+        try:
+            loaded = json.loads((self.save_logo_dir / NO_LOGO_FILE_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(loaded, dict):
+            return {}
+        now = self._clock_fn()
+        return {
+            str(key): float(since)
+            for key, since in loaded.items()
+            if isinstance(since, (int, float)) and now - since < NO_LOGO_TTL_SECONDS
+        }
+
+    def _record_no_logo(self, airline_iata: str | None, airline_icao: str | None) -> None:
+        now = self._clock_fn()
+        self._no_logo_since = {
+            key: since for key, since in self._no_logo_since.items() if now - since < NO_LOGO_TTL_SECONDS
+        }
+        self._no_logo_since[self._no_logo_key(airline_iata, airline_icao)] = now
+        if self.save_logo_dir is None:
+            return
+        path = self.save_logo_dir / NO_LOGO_FILE_NAME
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._no_logo_since), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _safe_base_name(airline_iata: str | None, airline_icao: str | None) -> str:
         file_base = airline_iata or airline_icao or "airline_logo"
-        safe = "".join(c for c in str(file_base) if c.isalnum() or c in ("-", "_")).strip()
-        return safe or "airline_logo"
+        return _UNSAFE_CHARS_RE.sub("", str(file_base)) or "airline_logo"
 
     def _cached_logo_path(self, airline_iata: str | None, airline_icao: str | None):
         if not self.save_logo_dir:
             return None
-        path = self.save_logo_dir / f"{self._safe_base_name(airline_iata, airline_icao)}.png"
-        return path if path.exists() else None
+        return self._known_logos.get(self._safe_base_name(airline_iata, airline_icao))
 
     @staticmethod
     def _resize_logo_bytes(
@@ -34,22 +110,22 @@ class LogoManager:
         sharpen: bool = True,
         autocontrast: bool = True,
         flatten_bg: bool = True,
+        fast: bool = False,
     ):
-        try:
-            from PIL import Image, ImageFilter, ImageOps
-        except Exception:
+        if not _HAVE_PIL:
             return logo_bytes, None
 
         try:
-            src = Image.open(BytesIO(logo_bytes)).convert("RGBA")
+            src: Image.Image = Image.open(BytesIO(logo_bytes))
+            # JPEG sources decode at reduced scale (no-op for PNG/GIF).
+            src.draft("RGB", (target_w * 4, target_h * 4))
+            src = src.convert("RGBA")
         except Exception:
             return logo_bytes, None
 
         if flatten_bg and src.mode == "RGBA":
             try:
-                background = Image.new("RGBA", src.size, bg)
-                background.paste(src, mask=src.split()[3])
-                src = background
+                src = Image.alpha_composite(Image.new("RGBA", src.size, bg), src)
             except Exception:
                 pass
 
@@ -62,7 +138,11 @@ class LogoManager:
         new_h = max(1, int(round(h * scale)))
 
         try:
-            resized = src.resize((new_w, new_h), resample=Image.LANCZOS)
+            if fast and scale < 1:
+                resized = src.resize((new_w, new_h), resample=Image.Resampling.BOX)
+            else:
+                # reducing_gap box-reduces large sources before the LANCZOS pass.
+                resized = src.resize((new_w, new_h), resample=Image.LANCZOS, reducing_gap=2.0)
         except Exception:
             try:
                 resized = src.resize((new_w, new_h))
@@ -74,7 +154,8 @@ class LogoManager:
                 resized = ImageOps.autocontrast(resized, cutoff=0)
             except Exception:
                 pass
-        if sharpen:
+        # Flat-colour (vector-style) logos only gain ringing at edges from sharpening.
+        if sharpen and resized.getcolors(maxcolors=LOGO_FLAT_MAX_COLORS) is None:
             try:
                 resized = resized.filter(ImageFilter.UnsharpMask(radius=0.8, percent=150, threshold=2))
             except Exception:
@@ -88,13 +169,33 @@ class LogoManager:
         except Exception:
             canvas.paste(resized, (x, y))
 
+        if fast:
+            try:
+                # FASTOCTREE keeps the alpha channel when reducing to a palette.
+                canvas = canvas.quantize(colors=64, method=Image.Quantize.FASTOCTREE)
+            except Exception:
+                pass
+
         out = BytesIO()
         try:
-            canvas.save(out, format="PNG", optimize=True)
+            canvas.save(out, format="PNG", compress_level=1)
             return out.getvalue(), "png"
         except Exception:
             return logo_bytes, None
 
+    @staticmethod
+    def _prune_hash_cache(directory: Path) -> None:
+        with os.scandir(directory) as entries:
+            files = [entry for entry in entries if entry.is_file()]
+        if len(files) <= LOGO_HASH_CACHE_MAX_FILES:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[: len(files) - LOGO_HASH_CACHE_MAX_FILES]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
     @staticmethod
     def _extract_logo_bytes(logo_result):
         if isinstance(logo_result, tuple) and logo_result:
@@ -108,29 +209,48 @@ class LogoManager:
             return str(cached)
         if not self.save_logo_dir:
             return None
+        no_logo_since = self._no_logo_since.get(self._no_logo_key(airline_iata, airline_icao))
+        if no_logo_since is not None and self._clock_fn() - no_logo_since < NO_LOGO_TTL_SECONDS:
+            return None
 
         logo_result = provider.get_airline_logo(airline_iata, airline_icao)
         logo_bytes = self._extract_logo_bytes(logo_result)
         if not logo_bytes:
+            self._record_no_logo(airline_iata, airline_icao)
             return None
 
-        try:
-            resized_bytes, resized_ext = self._resize_logo_bytes(
-                logo_bytes,
-                target_w=64,
-                target_h=20,
-                bg=self.bg_color,
-                sharpen=True,
-                autocontrast=True,
-                flatten_bg=True,
-            )
-            to_save = resized_bytes if resized_bytes and resized_ext else logo_bytes
-        except Exception:
-            to_save = logo_bytes
+        # Airline code variants often share artwork; reuse a resize keyed by source bytes + background.
+        digest = hashlib.blake2b(repr((self.bg_color, self.fast_resize)).encode(), digest_size=16)
+        digest.update(logo_bytes)
+        by_hash_path = self.save_logo_dir / ".by_hash" / f"{digest.hexdigest()}.png"
+        if by_hash_path.exists():
+            to_save = by_hash_path.read_bytes()
+        else:
+            try:
+                resized_bytes, resized_ext = self._resize_logo_bytes(
+                    logo_bytes,
+                    target_w=64,
+                    target_h=20,
+                    bg=self.bg_color,
+                    sharpen=not self.fast_resize,
+                    autocontrast=not self.fast_resize,
+                    flatten_bg=True,
+                    fast=self.fast_resize,
+                )
+                to_save = resized_bytes if resized_bytes and resized_ext else logo_bytes
+            except Exception:
+                to_save = logo_bytes
+            try:
+                by_hash_path.parent.mkdir(exist_ok=True)
+                by_hash_path.write_bytes(to_save)
+                self._prune_hash_cache(by_hash_path.parent)
+            except OSError:
+                pass
 
-        file_name = f"{self._safe_base_name(airline_iata, airline_icao)}.png"
-        file_path = self.save_logo_dir / file_name
+        base_name = self._safe_base_name(airline_iata, airline_icao)
+        file_path = self.save_logo_dir / f"{base_name}.png"
         with open(file_path, "wb") as fh:
             fh.write(to_save)
+        self._known_logos[base_name] = file_path
         return str(file_path)
 
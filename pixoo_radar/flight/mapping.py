@@ -1,10 +1,35 @@
 """Flight payload mapping helpers."""
 
+# Payload fields read straight from the FR24 details dict, as (payload key, nested path).
+DETAIL_FIELD_PATHS = (
+    ("details_id", ("identification", "id")),
+    ("callsign", ("identification", "callsign")),
+    ("flight_number", ("identification", "number", "default")),
+    ("registration", ("aircraft", "registration")),
+    ("aircraft_type", ("aircraft", "model", "text")),
+    ("aircraft_type_icao", ("aircraft", "model", "code")),
+    ("airline", ("airline", "name")),
+    ("airline_icao", ("airline", "code", "icao")),
+    ("airline_iata", ("airline", "code", "iata")),
+    ("origin", ("airport", "origin", "code", "iata")),
+    ("destination", ("airport", "destination", "code", "iata")),
+    ("destination_icao", ("airport", "destination", "code", "icao")),
+    ("status", ("status", "text")),
+    ("scheduled_departure", ("time", "scheduled", "departure")),
+    ("scheduled_arrival", ("time", "scheduled", "arrival")),
+    ("estimated_arrival", ("time", "estimated", "arrival")),
+)
+
 
 def safe_get(mapping, *keys):
     """Nested dict lookup with graceful None fallback."""
+    return dig(mapping, keys)
+
+
+def dig(mapping, path: tuple):
+    """Like `safe_get`, but takes the key path as one tuple (no varargs packing)."""
     value = mapping
-    for key in keys:
+    for key in path:
         if not isinstance(value, dict):
             return None
         value = value.get(key)
@@ -14,32 +39,32 @@ def safe_get(mapping, *keys):
 def build_flight_payload(closest_flight, details: dict | None):
     """Map provider objects/details into a stable payload dict."""
     details = details or {}
+    fields = {name: dig(details, path) for name, path in DETAIL_FIELD_PATHS}
 
     trail_point = None
     if isinstance(details.get("trail"), list) and details["trail"]:
         trail_point = details["trail"][0] or details["trail"][-1]
 
     return {
-        "icao24": getattr(closest_flight, "icao", None) or safe_get(details, "identification", "id"),
-        "callsign": safe_get(details, "identification", "callsign") or getattr(closest_flight, "callsign", None),
-        "flight_number": safe_get(details, "identification", "number", "default"),
-        "registration": safe_get(details, "aircraft", "registration") or getattr(closest_flight, "registration", None),
-        "aircraft_type": safe_get(details, "aircraft", "model", "text"),
-        "aircraft_type_icao": safe_get(details, "aircraft", "model", "code"),
-        "airline": safe_get(details, "airline", "name"),
-        "airline_icao": safe_get(details, "airline", "code", "icao"),
-        "airline_iata": safe_get(details, "airline", "code", "iata"),
-        "origin": safe_get(details, "airport", "origin", "code", "iata"),
-        "destination": safe_get(details, "airport", "destination", "code", "iata"),
-        "destination_icao": safe_get(details, "airport", "destination", "code", "icao"),
+        "icao24": getattr(closest_flight, "icao", None) or fields["details_id"],
+        "callsign": fields["callsign"] or getattr(closest_flight, "callsign", None),
+        "flight_number": fields["flight_number"],
+        "registration": fields["registration"] or getattr(closest_flight, "registration", None),
+        "aircraft_type": fields["aircraft_type"],
+        "aircraft_type_icao": fields["aircraft_type_icao"],
+        "airline": fields["airline"],
+        "airline_icao": fields["airline_icao"],
+        "airline_iata": fields["airline_iata"],
+        "origin": fields["origin"],
+        "destination": fields["destination"],
+        "destination_icao": fields["destination_icao"],
         "latitude": getattr(closest_flight, "latitude", None) or (trail_point and trail_point.get("lat")),
         "longitude": getattr(closest_flight, "longitude", None) or (trail_point and trail_point.get("lng")),
         "altitude": getattr(closest_flight, "altitude", None),
         "ground_speed": getattr(closest_flight, "ground_speed", None),
         "heading": getattr(closest_flight, "heading", None),
-        "status": safe_get(details, "status", "text"),
-        "scheduled_departure": safe_get(details, "time", "scheduled", "departure"),
-        "scheduled_arrival": safe_get(details, "time", "scheduled", "arrival"),
-        "estimated_arrival": safe_get(details, "time", "estimated", "arrival"),
+        "status": fields["status"],
+        "scheduled_departure": fields["scheduled_departure"],
+        "scheduled_arrival": fields["scheduled_arrival"],
+        "estimated_arrival": fields["estimated_arrival"],
     }
-
@@ -1,6 +1,30 @@
 """METAR fetcher utilities."""
 
+from time import monotonic
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# NOAA station files update roughly hourly; reuse a report for a few minutes across polls.
+METAR_CACHE_TTL_SECONDS = 300.0
+METAR_CACHE_SIZE = 64
+_SESSION: requests.Session | None = None
+_METAR_CACHE: dict[str, tuple[float, dict]] = {}
+
+
+def _http_session() -> requests.Session:
+    """Shared keep-alive session so repeat METAR polls skip the TCP+TLS handshake."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        # requests already advertises gzip/deflate; NOAA asks API clients to identify themselves.
+        session.headers["User-Agent"] = "pixoo-radar/1.0"
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
 
 
 def fetch_metar_report(icao: str | None, timeout_seconds: int = 5):
@@ -9,20 +33,29 @@ def fetch_metar_report(icao: str | None, timeout_seconds: int = 5):
         return None
     station = str(icao).strip().upper()
     url = f"https://tgftp.nws.noaa.gov/data/observations/metar/stations/{station}.TXT"
+    now = monotonic()
+    cached = _METAR_CACHE.get(station)
+    if cached and now - cached[0] < METAR_CACHE_TTL_SECONDS:
+        return dict(cached[1])
     try:
-        response = requests.get(url, timeout=timeout_seconds)
+        response = _http_session().get(url, timeout=timeout_seconds)
         if response.status_code != 200:
             return None
-        lines = response.text.strip().splitlines()
-        if not lines:
+        body = response.text.strip()
+        if not body:
             return None
-        if len(lines) >= 2:
-            timestamp = lines[0].strip()
-            raw = lines[1].strip()
+        # Station files are "timestamp\nreport\n"; only the first two lines matter.
+        first, _, rest = body.partition("\n")
+        if rest:
+            timestamp = first.strip()
+            raw = rest.partition("\n")[0].strip()
         else:
             timestamp = None
-            raw = lines[0].strip()
-        return {"raw": raw, "timestamp": timestamp, "source": url}
+            raw = first.strip()
+        report = {"raw": raw, "timestamp": timestamp, "source": url}
+        if len(_METAR_CACHE) >= METAR_CACHE_SIZE and station not in _METAR_CACHE:
+            _METAR_CACHE.pop(next(iter(_METAR_CACHE)))
+        _METAR_CACHE[station] = (now, report)
+        return dict(report)
     except Exception:
         return None
-
@@ -1,36 +1,165 @@
 """FlightRadar24 provider adapter."""
 
-try:
-    # Expected package for this project: FlightRadarAPI (module: FlightRadar24)
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
     from FlightRadar24.api import FlightRadar24API
-except ModuleNotFoundError as exc:
-    if exc.name == "FlightRadar24":
-        raise ImportError(
-            "Missing compatible FlightRadar24 client. Install `FlightRadarAPI` and remove `flightradar24` if present: "
-            "`pip uninstall -y flightradar24 && pip install FlightRadarAPI`."
-        ) from exc
-    if exc.name == "bs4":
-        raise ImportError(
-            "Missing dependency `beautifulsoup4` required by `FlightRadarAPI`. "
-            "Install it with: `pip install beautifulsoup4`."
-        ) from exc
-    raise
+
+LOGGER = logging.getLogger("pixoo_radar.flight")
+_FR24_SESSION_PATCHED = False
+
+
+def build_http_session() -> requests.Session:
+    """Return a pooled keep-alive session with a short retry budget for transient gateway errors."""
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _load_flightradar_api_class():
+    """
+    Import the FR24 client on first use.
+
+    FlightRadarAPI pulls in BeautifulSoup and friends; deferring it keeps the
+    controller's startup and Pixoo connect path free of that import cost.
+    """
+    try:
+        # Expected package for this project: FlightRadarAPI (module: FlightRadar24)
+        from FlightRadar24.api import FlightRadar24API
+    except ModuleNotFoundError as exc:
+        if exc.name == "FlightRadar24":
+            raise ImportError(
+                "Missing compatible FlightRadar24 client. Install `FlightRadarAPI` and remove `flightradar24` if present: "
+                "`pip uninstall -y flightradar24 && pip install FlightRadarAPI`."
+            ) from exc
+        if exc.name == "bs4":
+            raise ImportError(
+                "Missing dependency `beautifulsoup4` required by `FlightRadarAPI`. "
+                "Install it with: `pip install beautifulsoup4`."
+            ) from exc
+        raise
+    return FlightRadar24API
+
+
+def _install_flightradar_session_patch(session: requests.Session) -> None:
+    """
+    Route FlightRadar24 client requests through a shared session.
+
+    The upstream client calls module-level requests.get/post, so every poll
+    pays a fresh TCP+TLS handshake. Swapping in a session-backed namespace
+    keeps the connection alive across polls.
+    """
+    global _FR24_SESSION_PATCHED
+    if _FR24_SESSION_PATCHED:
+        return
+    try:
+        import FlightRadar24.request as fr24_request
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("Unable to apply FlightRadar24 session patch: %s", exc)
+        return
+    if not callable(getattr(getattr(fr24_request, "requests", None), "get", None)):
+        LOGGER.warning("Unable to apply FlightRadar24 session patch: request module layout not recognized.")
+        return
+
+    fr24_request.requests = SimpleNamespace(get=session.get, post=session.post)
+    _FR24_SESSION_PATCHED = True
+    LOGGER.info("Applied FlightRadar24 keep-alive session patch.")
 
 
 class FlightRadarProvider:
     """Small adapter around FlightRadar24 API client."""
 
-    def __init__(self, fr_api: FlightRadar24API | None = None, search_radius_meters: int = 50000):
-        self._client = fr_api or FlightRadar24API()
+    def __init__(
+        self,
+        fr_api: "FlightRadar24API | None" = None,
+        search_radius_meters: int = 50000,
+        session: requests.Session | None = None,
+        flights_cache_ttl_seconds: float = 0.0,
+        clock_fn=None,
+    ):
+        if fr_api is None:
+            fr_api_class = _load_flightradar_api_class()
+            _install_flightradar_session_patch(session or build_http_session())
+            fr_api = fr_api_class()
+        self._client = fr_api
         self.search_radius_meters = int(search_radius_meters)
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Non-empty search results reused for early re-polls (e.g. after a reconnect) at the same point.
+        self.flights_cache_ttl_seconds = float(flights_cache_ttl_seconds)
+        self._clock_fn = clock_fn or monotonic
+        self._flights_cache: tuple[tuple, float, list] | None = None
+        self._details_executor: ThreadPoolExecutor | None = None
+
+    def _coalesced(self, key: tuple, fetch, *args):
+        """
+        Run `fetch(*args)` once per key at a time.
+
+        A poll abandoned by the controller (e.g. Pixoo went offline) can still be
+        running when the next cycle starts; callers arriving while a request for
+        the same key is in flight share its result instead of repeating it.
+        """
+        future: Future = Future()
+        with self._inflight_lock:
+            pending = self._inflight.setdefault(key, future)
+        if pending is not future:
+            return pending.result()
+        try:
+            result = fetch(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
     def get_flights_near(self, latitude: float, longitude: float):
+        key = ("flights", round(latitude, 3), round(longitude, 3), self.search_radius_meters)
+        requested_at = self._clock_fn()
+        cached = self._flights_cache
+        if cached and cached[0] == key and requested_at - cached[1] < self.flights_cache_ttl_seconds:
+            return cached[2]
+        flights = self._coalesced(key, self._fetch_flights_near, latitude, longitude)
+        if flights and self.flights_cache_ttl_seconds > 0:
+            # Age the entry from when the search was sent, so a slow response does not outlive its TTL.
+            self._flights_cache = (key, requested_at, flights)
+        return flights
+
+    def _fetch_flights_near(self, latitude: float, longitude: float):
         bounds = self._client.get_bounds_by_point(latitude, longitude, self.search_radius_meters)
         return self._client.get_flights(bounds=bounds)
 
     def get_flight_details(self, flight):
-        return self._client.get_flight_details(flight)
+        flight_id = getattr(flight, "id", None)
+        if not flight_id:
+            return self._client.get_flight_details(flight)
+        return self._coalesced(("details", flight_id), self._client.get_flight_details, flight)
+
+    def get_flight_details_many(self, flights, max_workers: int = 4) -> list[Future]:
+        """Request details for several flights at once; returns one Future per flight, in order."""
+        if self._details_executor is None:
+            self._details_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pixoo-radar-fr24")
+        return [self._details_executor.submit(self.get_flight_details, flight) for flight in flights]
 
     def get_airline_logo(self, airline_iata: str | None, airline_icao: str | None):
+        key = ("logo", airline_iata, airline_icao)
+        return self._coalesced(key, self._fetch_airline_logo, airline_iata, airline_icao)
+
+    def _fetch_airline_logo(self, airline_iata: str | None, airline_icao: str | None):
         return self._client.get_airline_logo(iata=airline_iata, icao=airline_icao)
 
@@ -1,5 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+
+
+def _rounded(value) -> int:
+    # round() of a float already returns int; falsy values (None, "", 0) count as 0.
+    return round(float(value)) if value else 0
 
 
 class RenderState(str, Enum):
@@ -33,6 +39,17 @@ class FlightSnapshot:
             payload=data,
         )
 
+    @cached_property
+    def render_signature(self) -> tuple:
+        """Telemetry the flight view depends on; a change means the animation must be rebuilt."""
+        return (
+            self.icao24,
+            _rounded(self.altitude),
+            _rounded(self.ground_speed),
+            _rounded(self.heading),
+            str(self.status or ""),
+        )
+
 
 @dataclass(frozen=True)
 class WeatherSnapshot:
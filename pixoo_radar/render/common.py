@@ -1,9 +1,19 @@
 import logging
+from functools import lru_cache
 from math import cos, radians, sin
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
+try:
+    # Optional: JIT-compile the Bresenham stepping loop when numba is installed.
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ModuleNotFoundError:
+    _HAVE_NUMBA = False
+
 
 COLOR_ROUTE_LINE = "#666666"
 COLOR_PLANE = "#FFFFFF"
@@ -19,32 +29,36 @@ ROUTE_END = 43
 ROUTE_WIDTH = ROUTE_END - ROUTE_START
 AIRPLANE_CYCLE = ROUTE_WIDTH + PLANE_WIDTH
 TOTAL_FRAMES = AIRPLANE_CYCLE
+# Columns lit by a dashed separator: 2px dash, 2px gap across the 64px display.
+_DASHED_XS = np.flatnonzero(np.arange(64) % 4 < 2)
 
 
+@lru_cache(maxsize=256)
 def measure_text_width(text: str) -> int:
     return max(1, len(str(text)) * 6 - 1)
 
 
+@lru_cache(maxsize=256)
 def center_x(rect_width: int, text: str) -> int:
     return max(0, (rect_width - measure_text_width(text)) // 2)
 
 
-def draw_separator_line(pizzoo, y: int, style: str = "solid") -> None:
+def draw_separator_line(fb, y: int, style: str = "solid") -> None:
     if style == "solid":
-        pizzoo.draw_rectangle(xy=(0, y), width=64, height=1, color=COLOR_SEPARATOR, filled=True)
+        fb.fill_rect(0, y, 64, 1, COLOR_SEPARATOR)
     elif style == "dashed":
-        for x in range(0, 64, 4):
-            pizzoo.draw_rectangle(xy=(x, y), width=2, height=1, color=COLOR_SEPARATOR, filled=True)
+        fb.put_pixels(_DASHED_XS, np.full_like(_DASHED_XS, y), COLOR_SEPARATOR)
 
 
-def draw_airplane_icon(pizzoo, x: int, y: int, clip_left: int = 0, clip_right: int = 64, color: str = COLOR_PLANE) -> None:
-    for px in range(x, x + 5):
-        if clip_left <= px < clip_right:
-            pizzoo.draw_rectangle(xy=(px, y + 2), width=1, height=1, color=color, filled=True)
+def draw_airplane_icon(fb, x: int, y: int, clip_left: int = 0, clip_right: int = 64, color: str = COLOR_PLANE) -> None:
+    left = max(x, clip_left)
+    right = min(x + 5, clip_right)
+    if left < right:
+        fb.fill_rect(left, y + 2, right - left, 1, color)
     if clip_left <= x + 2 < clip_right:
-        pizzoo.draw_rectangle(xy=(x + 2, y), width=1, height=5, color=color, filled=True)
+        fb.fill_rect(x + 2, y, 1, 5, color)
     if clip_left <= x < clip_right:
-        pizzoo.draw_rectangle(xy=(x, y + 1), width=1, height=3, color=color, filled=True)
+        fb.fill_rect(x, y + 1, 1, 3, color)
 
 
 def fit_text(text: str, max_chars: int = 10) -> str:
@@ -62,29 +76,43 @@ def runway_designator(heading_deg: float) -> str:
     return f"{runway:02d}"
 
 
+# Unit vectors for every whole-degree bearing (headings and wind directions are reported in whole degrees).
+_BEARING_UNIT = tuple((sin(radians(bearing)), cos(radians(bearing))) for bearing in range(360))
+
+
 def bearing_to_xy(cx: int, cy: int, bearing_deg: float, distance: float):
-    rad = radians(float(bearing_deg) % 360.0)
-    return int(round(cx + distance * sin(rad))), int(round(cy - distance * cos(rad)))
+    bearing = float(bearing_deg) % 360.0
+    if bearing.is_integer():
+        unit = _BEARING_UNIT[int(bearing) % 360]
+    else:
+        rad = radians(bearing)
+        unit = (sin(rad), cos(rad))
+    return int(round(cx + distance * unit[0])), int(round(cy - distance * unit[1]))
+
 
+def draw_px(fb, x: int, y: int, color: str) -> None:
+    fb.draw_px(x, y, color)
 
-def draw_px(pizzoo, x: int, y: int, color: str) -> None:
-    if 0 <= x < 64 and 0 <= y < 64:
-        pizzoo.draw_rectangle(xy=(x, y), width=1, height=1, color=color, filled=True)
 
+@lru_cache(maxsize=8)
+def _thickness_stamp(radius: int):
+    offsets = np.arange(-radius, radius + 1)
+    ox, oy = np.meshgrid(offsets, offsets, indexing="ij")
+    return ox.ravel(), oy.ravel()
 
-def draw_line(pizzoo, x0: int, y0: int, x1: int, y1: int, color: str, thickness: int = 1) -> None:
+
+def _bresenham_points(x0: int, y0: int, x1: int, y1: int):
     dx = abs(x1 - x0)
     sx = 1 if x0 < x1 else -1
     dy = -abs(y1 - y0)
     sy = 1 if y0 < y1 else -1
     err = dx + dy
-    radius = max(0, (thickness - 1) // 2)
-    while True:
-        for ox in range(-radius, radius + 1):
-            for oy in range(-radius, radius + 1):
-                draw_px(pizzoo, x0 + ox, y0 + oy, color)
-        if x0 == x1 and y0 == y1:
-            break
+    count = max(dx, -dy) + 1
+    xs = np.empty(count, dtype=np.int32)
+    ys = np.empty(count, dtype=np.int32)
+    for i in range(count):
+        xs[i] = x0
+        ys[i] = y0
         e2 = 2 * err
         if e2 >= dy:
             err += dy
@@ -92,6 +120,26 @@ def draw_line(pizzoo, x0: int, y0: int, x1: int, y1: int, color: str, thickness:
         if e2 <= dx:
             err += dx
             y0 += sy
+    return xs, ys
+
+
+if _HAVE_NUMBA:
+    _bresenham_points = njit(cache=True)(_bresenham_points)
+
+
+def line_points(x0: int, y0: int, x1: int, y1: int):
+    """Return Bresenham line pixel coordinates as `(xs, ys)` int arrays."""
+    return _bresenham_points(int(x0), int(y0), int(x1), int(y1))
+
+
+def draw_line(fb, x0: int, y0: int, x1: int, y1: int, color: str, thickness: int = 1) -> None:
+    xs, ys = line_points(x0, y0, x1, y1)
+    radius = max(0, (thickness - 1) // 2)
+    if radius:
+        ox, oy = _thickness_stamp(radius)
+        xs = (xs[:, None] + ox).ravel()
+        ys = (ys[:, None] + oy).ravel()
+    fb.put_pixels(xs, ys, color)
 
 
 def format_altitude_feet_raw(altitude_ft) -> str:
@@ -144,11 +192,18 @@ def format_wind_kph(wind_kph, wind_unit: str) -> str:
     return f"{int(round(float(wind_kph)))} Kmh"
 
 
+_COMPASS_POINTS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+# Reports are whole degrees, so index those directly; sector edges sit on half degrees (22.5, 67.5, ...).
+_WIND_DIR_BY_DEGREE = tuple(_COMPASS_POINTS[int((deg + 22.5) // 45) % 8] for deg in range(360))
+
+
 def format_wind_dir(wind_dir_deg) -> str:
     if wind_dir_deg is None:
         return "--"
-    directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    return directions[int((float(wind_dir_deg) + 22.5) // 45) % 8]
+    deg = float(wind_dir_deg) % 360.0
+    if deg.is_integer():
+        return _WIND_DIR_BY_DEGREE[int(deg)]
+    return _COMPASS_POINTS[int((deg + 22.5) // 45) % 8]
 
 
 def dump_render_debug_gif(pizzoo, frame_speed: int, output_path: Path = DEBUG_RENDER_GIF_PATH) -> bool:
@@ -168,11 +223,16 @@ def dump_render_debug_gif(pizzoo, frame_speed: int, output_path: Path = DEBUG_RE
         return False
 
     expected_len = size * size * 3
-    images = []
     for frame in buffer:
         if not isinstance(frame, list) or len(frame) != expected_len:
             return False
-        images.append(Image.frombytes("RGB", (size, size), bytes(frame), "raw"))
+
+    strip = Image.frombytes("RGB", (size, size * len(buffer)), b"".join(bytes(frame) for frame in buffer), "raw")
+    shared_palette = strip.getcolors(maxcolors=256) is not None
+    if shared_palette:
+        # Every frame fits one exact 256-color palette, so quantize once and skip per-frame optimization.
+        strip = strip.convert("P", palette=Image.Palette.ADAPTIVE, colors=256)
+    images = [strip.crop((0, size * idx, size, size * (idx + 1))) for idx in range(len(buffer))]
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     images[0].save(
@@ -182,6 +242,7 @@ def dump_render_debug_gif(pizzoo, frame_speed: int, output_path: Path = DEBUG_RE
         append_images=images[1:],
         loop=0,
         duration=max(1, int(frame_speed)),
+        optimize=not shared_palette,
     )
     LOGGER.info("Saved render debug GIF: %s (%s frames)", output_path, len(images))
     return True
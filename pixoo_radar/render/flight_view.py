@@ -1,13 +1,17 @@
 import logging
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageOps
 
 from .common import (
     AIRPLANE_CYCLE,
     COLOR_LABEL,
     COLOR_ROUTE_LINE,
+    PLANE_WIDTH,
     ROUTE_END,
     ROUTE_START,
     TOTAL_FRAMES,
@@ -21,6 +25,7 @@ from .common import (
     format_speed,
     measure_text_width,
 )
+from .framebuffer import Framebuffer
 
 LOGGER = logging.getLogger("pixoo_radar")
 
@@ -29,6 +34,8 @@ TOP_TEXT_HEIGHT = 7
 TOP_TEXT_Y_CENTERED = (TOP_BAND_HEIGHT - TOP_TEXT_HEIGHT) // 2
 TOP_TEXT_Y_STATIC = 7
 AIRLINE_SCROLL_GAP_PX = 12
+# Columns lit by the dotted route line: a 2px dot every 3px from ROUTE_START.
+_ROUTE_DOT_XS = np.add.outer(np.arange(ROUTE_START, ROUTE_END, 3), (0, 1)).ravel()
 AIRCRAFT_MODEL_DISPLAY_MAP_PATH = Path(__file__).resolve().parents[2] / "data" / "icao_model_display_map.json"
 
 
@@ -82,36 +89,55 @@ def _draw_airline_name(pizzoo, settings, airline_name: str, frame_idx: int | Non
     pizzoo.draw_text(name, xy=(primary_x, TOP_TEXT_Y_CENTERED), font=settings.font_name, color="#FFFFFF", line_width=line_width)
 
 
+@lru_cache(maxsize=16)
+def _fitted_logo_rgba(logo_path: str, mtime_ns: int):
+    with Image.open(logo_path) as image:
+        fitted = ImageOps.fit(image, (64, TOP_BAND_HEIGHT), method=Image.LANCZOS, centering=(0.5, 0.5))
+        rgba = np.array(fitted.convert("RGBA"), dtype=np.uint8)
+    rgba.setflags(write=False)
+    return rgba
+
+
+def load_logo_rgba(logo_path: str):
+    """Load an airline logo fitted to the 64x20 top band as a read-only RGBA array (cached per file version)."""
+    return _fitted_logo_rgba(logo_path, os.stat(logo_path).st_mtime_ns)
+
+
+def draw_top_section_background(fb, settings, y_route: int = 20, logo_rgba=None) -> None:
+    if logo_rgba is not None:
+        fb.blit_rgba(0, 0, logo_rgba)
+    draw_separator_line(fb, y=20, style="dashed")
+    fb.fill_rect(0, 21, 64, 11, settings.color_box)
+    fb.put_pixels(_ROUTE_DOT_XS, np.full_like(_ROUTE_DOT_XS, y_route + 6), COLOR_ROUTE_LINE)
+
+
 def draw_top_section(
     pizzoo,
     settings,
-    logo: str,
     origin: str,
     destination: str,
     airline_name: str = "",
     y_route: int = 20,
     frame_idx: int | None = None,
 ) -> None:
-    if logo:
-        pizzoo.draw_image(logo, xy=(0, 0), size=(64, 20), resample_method=Image.LANCZOS)
-    elif airline_name:
+    if airline_name:
         _draw_airline_name(pizzoo, settings, airline_name, frame_idx=frame_idx)
 
-    draw_separator_line(pizzoo, y=20, style="dashed")
-    pizzoo.draw_rectangle(xy=(0, 21), width=64, height=11, color=settings.color_box, filled=True)
     pizzoo.draw_text(origin, xy=(2, y_route), font=settings.font_name, color=settings.color_text)
     dest_width = measure_text_width(destination)
     pizzoo.draw_text(destination, xy=(62 - dest_width, y_route), font=settings.font_name, color=settings.color_text)
 
-    for i in range(ROUTE_START, ROUTE_END, 3):
-        pizzoo.draw_rectangle(xy=(i, y_route + 6), width=2, height=1, color=COLOR_ROUTE_LINE, filled=True)
+
+@lru_cache(maxsize=64)
+def label_value_positions(label: str, value: str) -> tuple[int, int]:
+    """Return `(label_x, value_x)` for a centered `LABEL value` row."""
+    x_start = center_x(64, f"{label} {value}")
+    return x_start, x_start + (len(label) + 1) * 6
 
 
 def draw_label_value(pizzoo, settings, label: str, value: str, y: int) -> None:
-    full_text = f"{label} {value}"
-    x_start = center_x(64, full_text)
+    x_start, value_x = label_value_positions(label, value)
     pizzoo.draw_text(label, xy=(x_start, y), font=settings.font_name, color=COLOR_LABEL)
-    value_x = x_start + (len(label) + 1) * 6
     pizzoo.draw_text(value, xy=(value_x, y), font=settings.font_name, color=settings.color_text)
 
 
@@ -132,14 +158,17 @@ def draw_altitude_ft_value(pizzoo, settings, altitude_raw, y: int) -> None:
     pizzoo.draw_text(suffix, xy=(suffix_x, y), font=settings.font_name, color=COLOR_LABEL)
 
 
+def draw_info_page_background(fb, settings) -> None:
+    fb.fill_rect(0, 33, 64, 31, settings.color_box)
+    draw_separator_line(fb, y=32, style="dashed")
+    draw_separator_line(fb, y=48, style="dashed")
+
+
 def draw_info_page(pizzoo, settings, upper_pair: tuple, lower_pair: tuple) -> None:
-    pizzoo.draw_rectangle(xy=(0, 33), width=64, height=31, color=settings.color_box, filled=True)
-    draw_separator_line(pizzoo, y=32, style="dashed")
     if upper_pair[0] == "__TEXT_ONLY__":
         draw_value_only(pizzoo, settings, upper_pair[1], y=34)
     else:
         draw_label_value(pizzoo, settings, upper_pair[0], upper_pair[1], y=34)
-    draw_separator_line(pizzoo, y=48, style="dashed")
     if lower_pair[0] == "__ALT_RAW_FT__":
         draw_altitude_ft_value(pizzoo, settings, lower_pair[1], y=50)
     else:
@@ -183,15 +212,46 @@ def build_and_send_animation(pizzoo, settings, data: dict) -> None:
     frames_per_page = TOTAL_FRAMES // len(info_pages)
     y_route = 20
 
+    logo_rgba = None
+    if logo:
+        try:
+            logo_rgba = load_logo_rgba(logo)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Failed to load airline logo '%s' (%s); showing airline name instead.", logo, exc)
+
+    # Only the airplane (and a scrolling airline name) changes between frames,
+    # so each info page is composed once and copied per frame.
+    static_top = logo_rgba is not None or measure_text_width(airline_name) <= 64
+    base_airline_name = airline_name if logo_rgba is None and static_top else ""
+    background = Framebuffer()
+    draw_top_section_background(background, settings, y_route, logo_rgba=logo_rgba)
+    draw_info_page_background(background, settings)
+    page_bases = []
+    for upper_pair, lower_pair in info_pages:
+        background.push(pizzoo)
+        draw_top_section(pizzoo, settings, origin, destination, base_airline_name, y_route, frame_idx=0)
+        draw_info_page(pizzoo, settings, upper_pair, lower_pair)
+        page_bases.append(Framebuffer.from_pizzoo(pizzoo))
+
+    # Within a page only the airplane moves, so restore its previous 5x5
+    # patch from the base instead of copying the whole frame again.
+    plane_y = y_route + 4
+    fb = page_bases[0].copy()
+    fb_page_idx = 0
+    prev_plane_x = None
     for frame_idx in range(TOTAL_FRAMES):
-        pizzoo.cls()
-        draw_top_section(pizzoo, settings, logo, origin, destination, airline_name, y_route, frame_idx=frame_idx)
-        plane_x = ROUTE_START - 5 + (frame_idx % AIRPLANE_CYCLE)
-        draw_airplane_icon(pizzoo, plane_x, y_route + 4, clip_left=ROUTE_START, clip_right=ROUTE_END)
-
         page_idx = min(frame_idx // frames_per_page, len(info_pages) - 1)
-        upper_pair, lower_pair = info_pages[page_idx]
-        draw_info_page(pizzoo, settings, upper_pair, lower_pair)
+        if page_idx != fb_page_idx:
+            fb = page_bases[page_idx].copy()
+            fb_page_idx = page_idx
+        elif prev_plane_x is not None:
+            fb.restore_rect(page_bases[page_idx], prev_plane_x, plane_y, PLANE_WIDTH, PLANE_WIDTH)
+        plane_x = ROUTE_START - 5 + (frame_idx % AIRPLANE_CYCLE)
+        draw_airplane_icon(fb, plane_x, plane_y, clip_left=ROUTE_START, clip_right=ROUTE_END)
+        prev_plane_x = plane_x
+        fb.push(pizzoo)
+        if not static_top:
+            _draw_airline_name(pizzoo, settings, airline_name, frame_idx=frame_idx)
         if frame_idx < TOTAL_FRAMES - 1:
             pizzoo.add_frame()
 
@@ -0,0 +1,99 @@
+"""Off-device RGB frame buffer used to batch pixel drawing before a Pixoo push."""
+
+from functools import lru_cache
+
+import numpy as np
+from pizzoo._utils import get_color_rgb
+
+DISPLAY_SIZE = 64
+
+
+@lru_cache(maxsize=64)
+def hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """Convert `#RRGGBB` into an `(r, g, b)` tuple."""
+    token = str(color).strip()
+    if len(token) != 7 or not token.startswith("#"):
+        raise ValueError(f"Invalid color format: {color!r}")
+    return int(token[1:3], 16), int(token[3:5], 16), int(token[5:7], 16)
+
+
+def to_rgb(color) -> tuple[int, int, int]:
+    if isinstance(color, tuple):
+        return color
+    if isinstance(color, str) and color.strip().startswith("#"):
+        return hex_to_rgb(color)
+    # Palette indexes and "(r,g,b)" strings, as accepted by pizzoo's own draw calls.
+    r, g, b = get_color_rgb(color)
+    return int(r), int(g), int(b)
+
+
+@lru_cache(maxsize=64)
+def color_array(color) -> np.ndarray:
+    """Return a read-only `uint8` RGB triple for broadcast writes (parsed once per color)."""
+    rgb = np.array(to_rgb(color), dtype=np.uint8)
+    rgb.setflags(write=False)
+    return rgb
+
+
+class Framebuffer:
+    """64x64 RGB pixel array drawn locally and pushed to Pizzoo in one call."""
+
+    def __init__(self, color=(0, 0, 0), size: int = DISPLAY_SIZE):
+        self.size = size
+        self.arr = np.zeros((size, size, 3), dtype=np.uint8)
+        rgb = color_array(color)
+        if rgb.any():
+            self.arr[:, :] = rgb
+
+    @classmethod
+    def _wrap(cls, arr):
+        fb = cls.__new__(cls)
+        fb.size = arr.shape[0]
+        fb.arr = arr
+        return fb
+
+    @classmethod
+    def from_pizzoo(cls, pizzoo):
+        """Capture the current Pizzoo frame (including drawn text) as a framebuffer."""
+        size = int(pizzoo.size)
+        return cls._wrap(np.array(pizzoo.get_current_frame(), dtype=np.uint8).reshape(size, size, 3))
+
+    def copy(self):
+        return self._wrap(self.arr.copy())
+
+    def draw_px(self, x: int, y: int, color) -> None:
+        if 0 <= x < self.size and 0 <= y < self.size:
+            self.arr[y, x] = color_array(color)
+
+    def put_pixels(self, xs, ys, color) -> None:
+        """Set every in-bounds `(xs[i], ys[i])` pixel in one vectorized write."""
+        inside = (xs >= 0) & (xs < self.size) & (ys >= 0) & (ys < self.size)
+        self.arr[ys[inside], xs[inside]] = color_array(color)
+
+    def blit_rgba(self, x: int, y: int, rgba) -> None:
+        """Copy RGB from an `(h, w, 4)` array wherever alpha is non-zero (as `pizzoo.draw_image`)."""
+        h, w = rgba.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.size, x + w), min(self.size, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = rgba[y0 - y:y1 - y, x0 - x:x1 - x]
+        visible = src[..., 3] > 0
+        self.arr[y0:y1, x0:x1][visible] = src[..., :3][visible]
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color) -> None:
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.size, x + width), min(self.size, y + height)
+        if x0 < x1 and y0 < y1:
+            self.arr[y0:y1, x0:x1] = color_array(color)
+
+    def restore_rect(self, source, x: int, y: int, width: int, height: int) -> None:
+        """Copy a rectangle back from `source` (dirty-rectangle redraw)."""
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.size, x + width), min(self.size, y + height)
+        if x0 < x1 and y0 < y1:
+            self.arr[y0:y1, x0:x1] = source.arr[y0:y1, x0:x1]
+
+    def push(self, pizzoo) -> None:
+        """Replace the current Pizzoo frame with this buffer (text can still be drawn on top)."""
+        pizzoo.set_current_frame(self.arr.reshape(-1).tolist())
@@ -24,8 +24,8 @@ def build_and_send_poll_pause_screen(pizzoo, settings, resume_hhmm: str) -> None
     origin_x = random.randint(0, max_x)
     origin_y = random.randint(0, max_y)
 
+    # cls() already clears to black; a full-screen draw_rectangle would repaint it pixel by pixel.
     pizzoo.cls()
-    pizzoo.draw_rectangle(xy=(0, 0), width=64, height=64, color="#000000", filled=True)
     for line, y_offset in zip(lines, POLL_PAUSE_LINE_Y_OFFSETS):
         pizzoo.draw_text(
             line,
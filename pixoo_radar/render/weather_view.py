@@ -1,6 +1,9 @@
 import logging
+from functools import lru_cache
 from math import cos, radians, sin
 
+import numpy as np
+
 from .common import (
     bearing_to_xy,
     center_x,
@@ -13,10 +16,12 @@ from .common import (
     format_temp_c,
     format_wind_dir,
     format_wind_kph,
+    line_points,
     measure_text_width,
     runway_designator,
     signed_angle_diff_deg,
 )
+from .framebuffer import Framebuffer
 
 LOGGER = logging.getLogger("pixoo_radar")
 
@@ -123,7 +128,7 @@ def choose_runway_label_position(label_w: int, label_h: int, runway_heading_deg:
     return max(0, min(64 - label_w, tx - 2)), max(0, min(64 - label_h, ty + 1))
 
 
-def draw_home_icon(pizzoo, x: int = 1, y: int = 1, color: str = COLOR_HOME_ICON) -> None:
+def draw_home_icon(fb, x: int = 1, y: int = 1, color: str = COLOR_HOME_ICON) -> None:
     """Draw a tiny 10x9 house icon in the runway view corner."""
     # Roof drawn as explicit pixels for symmetric low-res rendering.
     roof_pixels = (
@@ -134,20 +139,52 @@ def draw_home_icon(pizzoo, x: int = 1, y: int = 1, color: str = COLOR_HOME_ICON)
         (0, 4), (9, 4),
     )
     for dx, dy in roof_pixels:
-        draw_px(pizzoo, x + dx, y + dy, color)
+        draw_px(fb, x + dx, y + dy, color)
 
     # House body outline.
     for dx in range(1, 9):
-        draw_px(pizzoo, x + dx, y + 4, color)
-        draw_px(pizzoo, x + dx, y + 8, color)
+        draw_px(fb, x + dx, y + 4, color)
+        draw_px(fb, x + dx, y + 8, color)
     for dy in range(4, 9):
-        draw_px(pizzoo, x + 1, y + dy, color)
-        draw_px(pizzoo, x + 8, y + dy, color)
+        draw_px(fb, x + 1, y + dy, color)
+        draw_px(fb, x + 8, y + dy, color)
 
     # Door (2x3).
     for dy in range(6, 9):
-        draw_px(pizzoo, x + 4, y + dy, color)
-        draw_px(pizzoo, x + 5, y + dy, color)
+        draw_px(fb, x + 4, y + dy, color)
+        draw_px(fb, x + 5, y + dy, color)
+
+
+@lru_cache(maxsize=1)
+def compass_tick_pixels():
+    """
+    Return `(xs, ys, bearings)` pixel arrays for the compass ring ticks.
+
+    The ring is static (fixed center, radii and view rotation), so tick
+    endpoints are computed for all bearings at once and rasterized a single
+    time per process. The tick at the top of the view is omitted so the `S`
+    marker stays legible.
+    """
+    bearings = np.arange(0, 360, 10)
+    view = (bearings + RUNWAY_VIEW_ROTATION_DEG) % 360.0
+    keep = np.round(view).astype(int) % 360 != 0
+    bearings, rad = bearings[keep], np.radians(view[keep])
+    sin_b, cos_b = np.sin(rad), np.cos(rad)
+    x1 = np.round(32 + 28 * sin_b).astype(int)
+    y1 = np.round(32 - 28 * cos_b).astype(int)
+    x2 = np.round(32 + 30 * sin_b).astype(int)
+    y2 = np.round(32 - 30 * cos_b).astype(int)
+
+    xs, ys, tick_bearings = [], [], []
+    for bearing, ax, ay, bx, by in zip(bearings, x1, y1, x2, y2, strict=True):
+        line_xs, line_ys = line_points(int(ax), int(ay), int(bx), int(by))
+        xs.append(line_xs)
+        ys.append(line_ys)
+        tick_bearings.append(np.full(len(line_xs), bearing))
+    ring = (np.concatenate(xs), np.concatenate(ys), np.concatenate(tick_bearings))
+    for arr in ring:
+        arr.setflags(write=False)
+    return ring
 
 
 def draw_runway_wind_diagram(pizzoo, settings, wind_dir_deg, runway_heading_deg: float, wind_dir_from=None, wind_dir_to=None) -> None:
@@ -156,8 +193,8 @@ def draw_runway_wind_diagram(pizzoo, settings, wind_dir_deg, runway_heading_deg:
 
     cx, cy = 32, 32
     runway_half_len = 22
-    pizzoo.draw_rectangle(xy=(0, 0), width=64, height=64, color=COLOR_WX_BG, filled=True)
-    draw_home_icon(pizzoo, x=54, y=54)
+    fb = Framebuffer(COLOR_WX_BG)
+    draw_home_icon(fb, x=54, y=54)
 
     highlighted_ticks = set()
     from_tick = nearest_drawn_tick_bearing(wind_dir_from)
@@ -169,26 +206,24 @@ def draw_runway_wind_diagram(pizzoo, settings, wind_dir_deg, runway_heading_deg:
         highlighted_ticks.add(to_tick)
     sector_inner_ticks = sector_ticks - highlighted_ticks
 
-    for b in range(0, 360, 10):
-        vb = view_bearing(b)
-        if int(round(vb)) % 360 == 0:
-            continue
-        x1, y1 = bearing_to_xy(cx, cy, vb, 28)
-        x2, y2 = bearing_to_xy(cx, cy, vb, 30)
-        if b in highlighted_ticks:
-            tick_color = COLOR_WIND_ARROW
-        elif b in sector_inner_ticks:
-            tick_color = COLOR_WIND_SECTOR
-        else:
-            tick_color = COLOR_WX_ACCENT
-        draw_line(pizzoo, x1, y1, x2, y2, color=tick_color, thickness=1)
-
+    tick_xs, tick_ys, tick_bearings = compass_tick_pixels()
+    fb.put_pixels(tick_xs, tick_ys, COLOR_WX_ACCENT)
+    if sector_inner_ticks:
+        in_sector = np.isin(tick_bearings, list(sector_inner_ticks))
+        fb.put_pixels(tick_xs[in_sector], tick_ys[in_sector], COLOR_WIND_SECTOR)
+    if highlighted_ticks:
+        highlighted = np.isin(tick_bearings, list(highlighted_ticks))
+        fb.put_pixels(tick_xs[highlighted], tick_ys[highlighted], COLOR_WIND_ARROW)
+
+    # Text is drawn by pizzoo, so read the frame back after each label to keep later lines on top of it.
+    fb.push(pizzoo)
     pizzoo.draw_text("S", xy=(center_x(64, "S") + 2, -1), font=settings.runway_label_font_name, color=COLOR_WX_TEXT)
+    fb = Framebuffer.from_pizzoo(pizzoo)
 
     rx0, ry0 = bearing_to_xy(cx, cy, view_bearing(runway_heading_deg), runway_half_len)
     rx1, ry1 = bearing_to_xy(cx, cy, view_bearing((runway_heading_deg + 180) % 360), runway_half_len)
-    draw_line(pizzoo, rx0, ry0, rx1, ry1, color=COLOR_RWY, thickness=7)
-    draw_line(pizzoo, rx0, ry0, rx1, ry1, color=COLOR_RWY_MARK, thickness=1)
+    draw_line(fb, rx0, ry0, rx1, ry1, color=COLOR_RWY, thickness=7)
+    draw_line(fb, rx0, ry0, rx1, ry1, color=COLOR_RWY_MARK, thickness=1)
 
     active_heading = resolve_active_runway_heading(wind_dir_deg, runway_heading_deg)
     if active_heading is not None:
@@ -197,19 +232,21 @@ def draw_runway_wind_diagram(pizzoo, settings, wind_dir_deg, runway_heading_deg:
         else:
             ax0, ay0 = rx0, ry0
         ax1, ay1 = bearing_to_xy(ax0, ay0, view_bearing(active_heading), 11)
-        draw_line(pizzoo, ax0, ay0, ax1, ay1, color=COLOR_ACTIVE_RWY_ARROW, thickness=2)
+        draw_line(fb, ax0, ay0, ax1, ay1, color=COLOR_ACTIVE_RWY_ARROW, thickness=2)
         left = view_bearing((active_heading + 142.0) % 360.0)
         right = view_bearing((active_heading - 142.0) % 360.0)
         hx0, hy0 = bearing_to_xy(ax1, ay1, left, 3)
         hx1, hy1 = bearing_to_xy(ax1, ay1, right, 3)
-        draw_line(pizzoo, ax1, ay1, hx0, hy0, color=COLOR_ACTIVE_RWY_ARROW, thickness=1)
-        draw_line(pizzoo, ax1, ay1, hx1, hy1, color=COLOR_ACTIVE_RWY_ARROW, thickness=1)
+        draw_line(fb, ax1, ay1, hx0, hy0, color=COLOR_ACTIVE_RWY_ARROW, thickness=1)
+        draw_line(fb, ax1, ay1, hx1, hy1, color=COLOR_ACTIVE_RWY_ARROW, thickness=1)
 
         active_rwy = runway_designator(active_heading)
         label_w, label_h = measure_text_width(active_rwy), 7
         anchor_x, anchor_y = (ax0 + ax1) / 2.0, (ay0 + ay1) / 2.0
         tx, ty = choose_runway_label_position(label_w, label_h, runway_heading_deg, anchor_x, anchor_y)
+        fb.push(pizzoo)
         pizzoo.draw_text(active_rwy, xy=(tx, ty), font=settings.runway_label_font_name, color=COLOR_ACTIVE_RWY_ARROW)
+        fb = Framebuffer.from_pizzoo(pizzoo)
 
     wind_from = normalize_wind_dir_deg(wind_dir_deg)
     if wind_from is not None:
@@ -217,13 +254,15 @@ def draw_runway_wind_diagram(pizzoo, settings, wind_dir_deg, runway_heading_deg:
         wind_from_view = view_bearing(wind_from)
         ax0, ay0 = bearing_to_xy(cx, cy, wind_from_view, 24)
         ax1, ay1 = bearing_to_xy(cx, cy, wind_from_view, 10)
-        draw_line(pizzoo, ax0, ay0, ax1, ay1, color=COLOR_WIND_ARROW, thickness=2)
+        draw_line(fb, ax0, ay0, ax1, ay1, color=COLOR_WIND_ARROW, thickness=2)
         left = (shaft_bearing + 150.0) % 360.0
         right = (shaft_bearing - 150.0) % 360.0
         hx0, hy0 = bearing_to_xy(ax1, ay1, left, 4)
         hx1, hy1 = bearing_to_xy(ax1, ay1, right, 4)
-        draw_line(pizzoo, ax1, ay1, hx0, hy0, color=COLOR_WIND_ARROW, thickness=1)
-        draw_line(pizzoo, ax1, ay1, hx1, hy1, color=COLOR_WIND_ARROW, thickness=1)
+        draw_line(fb, ax1, ay1, hx0, hy0, color=COLOR_WIND_ARROW, thickness=1)
+        draw_line(fb, ax1, ay1, hx1, hy1, color=COLOR_WIND_ARROW, thickness=1)
+
+    fb.push(pizzoo)
 
 
 def build_and_send_weather_idle_screen(pizzoo, settings, weather: dict) -> None:
@@ -273,9 +312,9 @@ def draw_weather_summary_frame(pizzoo, settings, weather: dict) -> None:
         metar_time_local = str(weather.get("metar_time_z") or "").strip().upper()
     weather_header = fit_text(f"{metar_station} {metar_time_local}", 10) if metar_station and metar_time_local else "Weather"
 
-    pizzoo.cls()
-    pizzoo.draw_rectangle(xy=(0, 0), width=64, height=64, color=COLOR_WX_BG, filled=True)
-    pizzoo.draw_rectangle(xy=(0, 0), width=64, height=11, color=COLOR_WX_ACCENT, filled=True)
+    fb = Framebuffer(COLOR_WX_BG)
+    fb.fill_rect(0, 0, 64, 11, COLOR_WX_ACCENT)
+    fb.push(pizzoo)
     pizzoo.draw_text(weather_header, xy=(center_x(64, weather_header), -1), font=settings.font_name, color=COLOR_WX_TEXT)
     hum_line = fit_text(f"HUM {humidity}", 10)
     if wind_gust is not None and wind_speed is not None:
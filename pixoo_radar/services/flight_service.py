@@ -3,8 +3,8 @@ from pixoo_radar.models import FlightSnapshot
 
 
 class FlightService:
-    def __init__(self, logo_dir: str):
-        self._client = FlightData(save_logo_dir=logo_dir)
+    def __init__(self, logo_dir: str, logo_fast_resize: bool = False):
+        self._client = FlightData(save_logo_dir=logo_dir, logo_fast_resize=logo_fast_resize)
 
     def get_closest_flight(self, latitude: float, longitude: float):
         payload = self._client.get_closest_flight_data(latitude, longitude)
@@ -1,20 +1,27 @@
 import logging
+import random
 import socket
 from time import monotonic, sleep
 
+import requests
 from pizzoo import Pizzoo
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOGGER = logging.getLogger("pixoo_radar")
 PIXOO_HTTP_TIMEOUT_SECONDS = 5.0
+PIXOO_RECONNECT_MAX_SECONDS = 60.0
 _PIXOO_POST_TIMEOUT_PATCHED = False
 
 
 def _install_pizzoo_http_timeout_patch(timeout_seconds: float = PIXOO_HTTP_TIMEOUT_SECONDS) -> None:
     """
-    Patch pizzoo renderer HTTP calls to use a finite timeout.
+    Patch pizzoo renderer HTTP calls to use a finite timeout and keep-alive.
 
     The upstream library uses requests.post without timeout, which can block
-    indefinitely if the device disappears mid-render.
+    indefinitely if the device disappears mid-render. It also opens a new TCP
+    connection for every frame of `Draw/SendHttpGif`; routing posts through a
+    shared session reuses one connection for the whole animation upload.
     """
     global _PIXOO_POST_TIMEOUT_PATCHED
     if _PIXOO_POST_TIMEOUT_PATCHED:
@@ -30,13 +37,19 @@ def _install_pizzoo_http_timeout_patch(timeout_seconds: float = PIXOO_HTTP_TIMEO
         LOGGER.warning("Unable to apply Pixoo HTTP timeout patch: renderer post callable not found.")
         return
 
-    def post_with_timeout(*args, **kwargs):
+    session = requests.Session()
+    # One retry covers a keep-alive connection the device dropped while idle;
+    # re-sending a frame at the same PicOffset is harmless.
+    adapter = HTTPAdapter(pool_maxsize=1, max_retries=Retry(total=1, connect=0, read=1, status=0, allowed_methods=None))
+    session.mount("http://", adapter)
+
+    def post_with_timeout(url, data=None, **kwargs):
         kwargs.setdefault("timeout", timeout_seconds)
-        return original_post(*args, **kwargs)
+        return session.post(url, data, **kwargs)
 
     pizzoo_renderers.post = post_with_timeout
     _PIXOO_POST_TIMEOUT_PATCHED = True
-    LOGGER.info("Applied Pixoo HTTP timeout patch (%ss).", timeout_seconds)
+    LOGGER.info("Applied Pixoo HTTP timeout/keep-alive patch (%ss).", timeout_seconds)
 
 
 class PixooClient:
@@ -68,6 +81,8 @@ class PixooClient:
         deadline = None
         if fail_fast:
             deadline = monotonic() + float(self.settings.pixoo_startup_connect_timeout_seconds)
+        # Double the wait after each failure (capped) and add jitter so a flapping device is not hammered.
+        delay = float(self.settings.pixoo_reconnect_seconds)
         while True:
             try:
                 LOGGER.info("Connecting to Pixoo at %s:%s...", self.settings.pixoo_ip, self.settings.pixoo_port)
@@ -84,8 +99,12 @@ class PixooClient:
                         f"{self.settings.pixoo_ip}:{self.settings.pixoo_port} within "
                         f"{self.settings.pixoo_startup_connect_timeout_seconds}s: {exc}"
                     ) from exc
-                LOGGER.warning("Pixoo unavailable (%s). Retrying in %ss...", exc, self.settings.pixoo_reconnect_seconds)
-                sleep(self.settings.pixoo_reconnect_seconds)
+                wait = delay + random.uniform(0, delay * 0.3)
+                if deadline is not None:
+                    wait = min(wait, max(0.0, deadline - monotonic()))
+                LOGGER.warning("Pixoo unavailable (%s). Retrying in %.1fs...", exc, wait)
+                sleep(wait)
+                delay = min(delay * 2, max(PIXOO_RECONNECT_MAX_SECONDS, float(self.settings.pixoo_reconnect_seconds)))
 
     def is_reachable(self, timeout_seconds: float = 2.0) -> bool:
         try:
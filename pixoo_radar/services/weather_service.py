@@ -1,14 +1,30 @@
+from pathlib import Path
+
 from weather_data import WeatherData
 from pixoo_radar.models import WeatherSnapshot
 
+WEATHER_SNAPSHOT_PATH = Path.home() / ".cache" / "pixoo_radar" / "weather.json"
+# How long past its refresh interval cached weather may be shown while a background refresh runs.
+WEATHER_STALE_WHILE_REVALIDATE_SECONDS = 300
+
 
 class WeatherService:
-    def __init__(self, latitude: float, longitude: float, refresh_seconds: int, metar_icao: str = ""):
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        refresh_seconds: int,
+        metar_icao: str = "",
+        snapshot_path: str | Path | None = WEATHER_SNAPSHOT_PATH,
+        stale_while_revalidate_seconds: int = WEATHER_STALE_WHILE_REVALIDATE_SECONDS,
+    ):
         self._client = WeatherData(
             latitude=latitude,
             longitude=longitude,
             refresh_seconds=refresh_seconds,
             metar_icao=metar_icao,
+            snapshot_path=snapshot_path,
+            stale_while_revalidate_seconds=stale_while_revalidate_seconds,
         )
 
     def get_current(self):
@@ -25,5 +41,5 @@ class WeatherService:
     def seconds_until_refresh(self) -> int:
         return self._client.seconds_until_refresh()
 
-    def validate_startup_sources(self, require_metar: bool = False):
-        self._client.validate_startup_sources(require_metar=require_metar)
+    def validate_startup_sources(self, require_metar: bool = False) -> str:
+        return self._client.validate_startup_sources(require_metar=require_metar)
@@ -7,6 +7,9 @@ from pathlib import Path
 
 import config as app_config
 
+PAUSE_TIME_RE = re.compile(r"^(?:[01]\d|2[0-3])[0-5]\d$")
+MISSING_ATTR_RE = re.compile(r"has no attribute '([^']+)'")
+
 
 @dataclass(frozen=True)
 class AppSettings:
@@ -36,6 +39,12 @@ class AppSettings:
     pixoo_startup_connect_timeout_seconds: int = 120
     poll_pause_start_local: str = ""
     poll_pause_end_local: str = ""
+    logo_fast_resize: bool = False
+
+    @property
+    def requires_metar(self) -> bool:
+        """True when a METAR station is configured (enables METAR fetch and its dependencies)."""
+        return bool(self.weather_metar_icao)
 
 
 def _valid_log_level(level_name: str) -> bool:
@@ -48,13 +57,12 @@ def validate_settings(settings: AppSettings) -> AppSettings:
 
     pause_start = str(settings.poll_pause_start_local or "").strip()
     pause_end = str(settings.poll_pause_end_local or "").strip()
-    pause_time_re = re.compile(r"^(?:[01]\d|2[0-3])[0-5]\d$")
     if bool(pause_start) != bool(pause_end):
         errors.append("POLL_PAUSE_START_LOCAL and POLL_PAUSE_END_LOCAL must both be set, or both be blank.")
     elif pause_start:
-        if not pause_time_re.match(pause_start):
+        if not PAUSE_TIME_RE.match(pause_start):
             errors.append("POLL_PAUSE_START_LOCAL must use 24-hour HHMM format (for example 0000, 0730).")
-        if not pause_time_re.match(pause_end):
+        if not PAUSE_TIME_RE.match(pause_end):
             errors.append("POLL_PAUSE_END_LOCAL must use 24-hour HHMM format (for example 0700, 2315).")
         if pause_start == pause_end:
             errors.append("POLL_PAUSE_START_LOCAL and POLL_PAUSE_END_LOCAL must not be equal.")
@@ -92,16 +100,16 @@ def validate_settings(settings: AppSettings) -> AppSettings:
         errors.append("FLIGHT_SPEED_UNIT must be 'mph' or 'kt'.")
     if str(settings.weather_wind_speed_unit).lower() not in {"mph", "kmh", "kph"}:
         errors.append("WEATHER_WIND_SPEED_UNIT must be 'mph' or 'kmh' (legacy 'kph' accepted).")
-    if settings.weather_metar_icao and (len(str(settings.weather_metar_icao).strip()) != 4 or not str(settings.weather_metar_icao).strip().isalnum()):
+    if settings.requires_metar and (len(str(settings.weather_metar_icao).strip()) != 4 or not str(settings.weather_metar_icao).strip().isalnum()):
         errors.append("WEATHER_METAR_ICAO must be a 4-character ICAO station code when set.")
-    if settings.weather_metar_icao and find_spec("metar") is None:
+    if settings.requires_metar and find_spec("metar") is None:
         errors.append("WEATHER_METAR_ICAO is set, but dependency 'metar' is not installed. Install with: pip install metar")
-    if settings.weather_metar_icao and find_spec("timezonefinder") is None:
+    if settings.requires_metar and find_spec("timezonefinder") is None:
         errors.append(
             "WEATHER_METAR_ICAO is set, but dependency 'timezonefinder' is not installed. "
             "Install with: pip install timezonefinder"
         )
-    if settings.weather_metar_icao and find_spec("airportsdata") is None:
+    if settings.requires_metar and find_spec("airportsdata") is None:
         errors.append(
             "WEATHER_METAR_ICAO is set, but dependency 'airportsdata' is not installed. "
             "Install with: pip install airportsdata"
@@ -155,9 +163,10 @@ def load_settings() -> AppSettings:
             pixoo_startup_connect_timeout_seconds=getattr(app_config, "PIXOO_STARTUP_CONNECT_TIMEOUT_SECONDS", 120),
             poll_pause_start_local=getattr(app_config, "POLL_PAUSE_START_LOCAL", ""),
             poll_pause_end_local=getattr(app_config, "POLL_PAUSE_END_LOCAL", ""),
+            logo_fast_resize=bool(getattr(app_config, "LOGO_FAST_RESIZE", False)),
         )
     except AttributeError as exc:
-        attr_match = re.search(r"has no attribute '([^']+)'", str(exc))
+        attr_match = MISSING_ATTR_RE.search(str(exc))
         missing_attr = attr_match.group(1) if attr_match else str(exc)
         raise ValueError(f"Invalid configuration:\n- Missing required config setting: {missing_attr}") from exc
     return validate_settings(settings)
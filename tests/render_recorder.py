@@ -1,9 +1,33 @@
 """Test helper: record Pixoo drawing API calls for golden assertions."""
 
+import hashlib
+
+from pizzoo import Pizzoo
+from pizzoo._renderers import Renderer
+
 
 class RecordingPizzoo:
     def __init__(self):
         self.ops = []
+        self.frames = []
+        self.size = 64
+
+    def set_current_frame(self, frame):
+        self.frames.append(list(frame))
+        self.ops.append(
+            {
+                "op": "set_current_frame",
+                "sha256": hashlib.sha256(bytes(frame)).hexdigest(),
+            }
+        )
+
+    def get_current_frame(self):
+        return list(self.frames[-1])
+
+    def frame_colors(self, index: int = -1) -> set[str]:
+        """Return `#RRGGBB` colors present in a pushed frame buffer."""
+        frame = self.frames[index]
+        return {"#%02X%02X%02X" % tuple(frame[i:i + 3]) for i in range(0, len(frame), 3)}
 
     def cls(self):
         self.ops.append({"op": "cls"})
@@ -48,3 +72,22 @@ class RecordingPizzoo:
     def render(self, frame_speed):
         self.ops.append({"op": "render", "frame_speed": int(frame_speed)})
 
+
+
+class _NullRenderer(Renderer):
+    def __init__(self, address, pizzoo, debug):
+        super().__init__(address, pizzoo, debug)
+        self._size = 64
+        self._max_frames = 60
+
+    def render(self, buffer, frame_speed):
+        return None
+
+
+def rendering_pizzoo(settings) -> Pizzoo:
+    """Return a real Pizzoo (text rasterized) that never talks to a device."""
+    pizzoo = Pizzoo("127.0.0.1", renderer=_NullRenderer)
+    pizzoo.load_font(settings.font_name, settings.font_path)
+    if settings.runway_label_font_name != settings.font_name:
+        pizzoo.load_font(settings.runway_label_font_name, settings.runway_label_font_path)
+    return pizzoo
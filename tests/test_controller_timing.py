@@ -1,3 +1,4 @@
+import threading
 from datetime import time
 
 from pixoo_radar.controller import PixooRadarController
@@ -87,9 +88,20 @@ class FakeWeatherService:
 
 
 class FakePizzoo:
+    size = 64
+
+    def __init__(self):
+        self.frame = [0] * (64 * 64 * 3)
+
     def cls(self):
         return None
 
+    def set_current_frame(self, frame):
+        self.frame = frame
+
+    def get_current_frame(self):
+        return self.frame
+
     def draw_rectangle(self, **kwargs):
         return None
 
@@ -228,3 +240,244 @@ def test_pause_holding_screen_sent_once_per_pause_window(monkeypatch):
     controller.run_once()
     assert sent == ["0700", "0700"]
     assert sleeps == [60, 60, 60, 60]
+
+
+def test_refreshed_weather_with_identical_payload_is_not_resent(monkeypatch):
+    sent = []
+
+    class RefreshingWeatherService(FakeWeatherService):
+        def get_current(self):
+            return self._snapshot(), True
+
+    controller = PixooRadarController(
+        _settings(),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=FakeFlightService(snapshot=None),
+        weather_service=RefreshingWeatherService(),
+        sleep_fn=lambda _seconds: None,
+        clock_fn=lambda: 1.0,
+    )
+    controller.pizzoo = FakePizzoo()
+    monkeypatch.setattr(
+        "pixoo_radar.controller.build_and_send_weather_idle_screen",
+        lambda _p, _s, weather: sent.append(weather["condition"]),
+    )
+
+    controller.run_once()
+    controller.run_once()
+    assert sent == ["CLEAR"]
+
+    controller.reset_tracking()
+    controller.run_once()
+    assert sent == ["CLEAR", "CLEAR"]
+
+
+def test_weather_screen_is_resent_after_pause_holding_screen(monkeypatch):
+    shown = []
+    current = {"time": time(8, 0)}
+
+    class RefreshingWeatherService(FakeWeatherService):
+        def get_current(self):
+            return self._snapshot(), True
+
+    controller = PixooRadarController(
+        _settings(poll_pause_start_local="0000", poll_pause_end_local="0700"),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=FakeFlightService(snapshot=None),
+        weather_service=RefreshingWeatherService(),
+        sleep_fn=lambda _seconds: None,
+        clock_fn=lambda: 1.0,
+        local_time_fn=lambda: current["time"],
+    )
+    controller.pizzoo = FakePizzoo()
+    monkeypatch.setattr("pixoo_radar.controller.build_and_send_poll_pause_screen", lambda *_args, **_kwargs: shown.append("pause"))
+    monkeypatch.setattr("pixoo_radar.controller.build_and_send_weather_idle_screen", lambda *_args: shown.append("weather"))
+
+    controller.run_once()
+    current["time"] = time(1, 0)
+    controller.run_once()
+    current["time"] = time(7, 30)
+    controller.run_once()
+    controller.run_once()
+    assert shown == ["weather", "pause", "weather"]
+
+
+def test_due_weather_refresh_overlaps_flight_poll(monkeypatch):
+    both_started = threading.Barrier(2, timeout=2)
+    sent = []
+
+    class SlowFlightService(FakeFlightService):
+        def get_closest_flight(self, latitude, longitude):
+            both_started.wait()
+            return super().get_closest_flight(latitude, longitude)
+
+    class DueWeatherService(FakeWeatherService):
+        def get_current(self):
+            both_started.wait()
+            return self._snapshot(), True
+
+        def seconds_until_refresh(self):
+            return 0
+
+    controller = PixooRadarController(
+        _settings(),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=SlowFlightService(snapshot=None),
+        weather_service=DueWeatherService(),
+        sleep_fn=lambda _seconds: None,
+        clock_fn=lambda: 1.0,
+    )
+    controller.pizzoo = FakePizzoo()
+    controller.current_state = RenderState.IDLE_WEATHER
+    monkeypatch.setattr(
+        "pixoo_radar.controller.build_and_send_weather_idle_screen",
+        lambda _p, _s, weather: sent.append(weather["condition"]),
+    )
+
+    controller.run_once()
+
+    assert sent == ["CLEAR"]
+
+
+def test_offline_display_skips_flight_and_weather_apis():
+    flight_service = FakeFlightService(snapshot=None)
+    pixoo_service = FakePixooService(reachable=False)
+    controller = PixooRadarController(
+        _settings(),
+        pixoo_service=pixoo_service,
+        flight_service=flight_service,
+        weather_service=FakeWeatherService(),
+        sleep_fn=lambda _seconds: None,
+        clock_fn=lambda: 1.0,
+    )
+    controller.pizzoo = FakePizzoo()
+    controller.run_once()
+    assert flight_service.calls == 0
+    assert pixoo_service.connect_calls == 1
+
+
+def test_failed_weather_refresh_is_logged_when_a_flight_is_shown(monkeypatch, caplog):
+    class FailingWeatherService(FakeWeatherService):
+        def get_current(self):
+            raise RuntimeError("weather api down")
+
+        def seconds_until_refresh(self):
+            return 0
+
+    controller = PixooRadarController(
+        _settings(),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=FakeFlightService(snapshot=FlightSnapshot.from_dict({"icao24": "abc123", "altitude": 1000})),
+        weather_service=FailingWeatherService(),
+        sleep_fn=lambda _seconds: None,
+        clock_fn=lambda: 1.0,
+    )
+    controller.pizzoo = FakePizzoo()
+    controller.current_state = RenderState.IDLE_WEATHER
+    monkeypatch.setattr("pixoo_radar.controller.build_and_send_animation", lambda *_args: None)
+
+    controller.run_once()
+    controller._io_executor.shutdown(wait=True)
+
+    assert "weather api down" in caplog.text
+
+
+def test_flight_render_does_not_wait_for_speculative_weather_refresh(monkeypatch):
+    weather_release = threading.Event()
+    weather_done = threading.Event()
+    weather_pending_at_render = []
+
+    class SlowWeatherService(FakeWeatherService):
+        def get_current(self):
+            weather_release.wait(timeout=2)
+            weather_done.set()
+            return self._snapshot(), True
+
+        def seconds_until_refresh(self):
+            return 0
+
+    controller = PixooRadarController(
+        _settings(),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=FakeFlightService(snapshot=FlightSnapshot.from_dict({"icao24": "abc123", "altitude": 1000})),
+        weather_service=SlowWeatherService(),
+        sleep_fn=lambda _seconds: None,
+        clock_fn=lambda: 1.0,
+    )
+    controller.pizzoo = FakePizzoo()
+    controller.current_state = RenderState.IDLE_WEATHER
+    monkeypatch.setattr(
+        "pixoo_radar.controller.build_and_send_animation",
+        lambda *_args: weather_pending_at_render.append(not weather_done.is_set()),
+    )
+
+    controller.run_once()
+    weather_release.set()
+    controller._io_executor.shutdown(wait=True)
+
+    assert weather_pending_at_render == [True]
+
+
+def test_run_shuts_down_io_pool_after_stop():
+    controller = PixooRadarController(
+        _settings(),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=FakeFlightService(snapshot=None),
+        weather_service=FakeWeatherService(),
+    )
+    controller.stop()
+    controller.run()
+    assert controller._io_executor._shutdown
+
+
+def test_render_signature_ignores_sub_unit_jitter_and_is_cached():
+    base = {"icao24": "abc123", "altitude": 12000.2, "ground_speed": 250.4, "heading": 90.1, "status": "CLIMB"}
+    snapshot = FlightSnapshot.from_dict(base)
+    jittered = FlightSnapshot.from_dict({**base, "altitude": 11999.8, "heading": 89.9})
+    assert snapshot.render_signature == jittered.render_signature == ("abc123", 12000, 250, 90, "CLIMB")
+    assert snapshot.render_signature is snapshot.render_signature
+    assert PixooRadarController.flight_render_signature(base) == snapshot.render_signature
+
+
+def test_idle_polls_back_off_until_a_flight_appears():
+    sleeps = []
+    flight_service = FakeFlightService(snapshot=None)
+    controller = PixooRadarController(
+        _settings(data_refresh_seconds=60),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=flight_service,
+        weather_service=FakeWeatherService(),
+        sleep_fn=sleeps.append,
+        clock_fn=lambda: 1.0,
+    )
+    controller.pizzoo = FakePizzoo()
+    for _ in range(5):
+        controller.run_once()
+    assert sleeps == [60, 120, 240, 300, 300]
+
+    flight_service.snapshot = FlightSnapshot.from_dict({"icao24": "abc123", "altitude": 1000})
+    controller.current_flight_id = "abc123"
+    controller.current_flight_signature = flight_service.snapshot.render_signature
+    controller.run_once()
+    flight_service.snapshot = None
+    controller.run_once()
+    assert sleeps[-2:] == [60, 60]
+
+
+def test_poll_wait_subtracts_time_spent_in_the_cycle():
+    sleeps = []
+    ticks = iter([100.0])
+    controller = PixooRadarController(
+        _settings(data_refresh_seconds=60),
+        pixoo_service=FakePixooService(reachable=True),
+        flight_service=FakeFlightService(snapshot=None),
+        weather_service=FakeWeatherService(),
+        sleep_fn=sleeps.append,
+        clock_fn=lambda: next(ticks, 107.5),
+    )
+    controller.pizzoo = FakePizzoo()
+
+    controller.run_once()
+
+    assert controller.last_cycle_started_at == 100.0
+    assert sleeps == [52.5]
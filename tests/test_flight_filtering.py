@@ -1,20 +1,32 @@
+import logging
+import threading
+import time
 from types import SimpleNamespace
 
-from flight_data import FlightData
-from pixoo_radar.flight.filters import choose_closest_flight
+import numpy as np
+
+from flight_data import LOGGER, FlightData, _debug_output_enabled
+from pixoo_radar.flight.filters import choose_closest_flight, haversine_km, haversine_km_array
+from pixoo_radar.flight.provider import FlightRadarProvider
 
 
 class FakeApi:
+    """FR24 client stand-in that counts calls per instance."""
+
     def __init__(self, flights):
         self._flights = flights
+        self.flight_calls = 0
+        self.detail_calls: list[str] = []
 
     def get_bounds_by_point(self, lat, lon, radius):
         return (lat, lon, radius)
 
     def get_flights(self, bounds=None):
+        self.flight_calls += 1
         return self._flights
 
     def get_flight_details(self, flight):
+        self.detail_calls.append(flight.icao)
         return {
             "identification": {"number": {"default": "AB123"}},
             "airport": {"origin": {"code": {"iata": "AAA"}}, "destination": {"code": {"iata": "BBB", "icao": "KBBB"}}},
@@ -106,3 +118,170 @@ def test_choose_closest_flight_can_return_filter_stats():
     assert stats["taxiing_ground"] == 1
     assert stats["usable"] == 1
     assert stats["selected_distance_km"] is not None
+
+
+def test_empty_search_area_is_not_requeried_immediately():
+    api = FakeApi([])
+    now = {"t": 100.0}
+    fd = FlightData(fr_api=api, clock_fn=lambda: now["t"])
+    assert fd.get_closest_flight_data(1.0, 1.0, save_logo=False) is None
+    now["t"] += 1
+    assert fd.get_closest_flight_data(1.0, 1.0, save_logo=False) is None
+    assert api.flight_calls == 1
+
+    now["t"] += 10
+    fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    assert api.flight_calls == 2
+
+
+def test_airline_logo_is_resolved_once_per_airline():
+    class CountingLogoManager:
+        def __init__(self):
+            self.calls = 0
+
+        def resolve_or_fetch_logo(self, provider, airline_iata, airline_icao):
+            self.calls += 1
+            return f"logos/{airline_iata}.png"
+
+    logo_manager = CountingLogoManager()
+    moving = _flight(icao="icao1", altitude=1000, ground_speed=250, heading=20)
+    fd = FlightData(fr_api=FakeApi([moving]), logo_manager=logo_manager)
+    first = fd.get_closest_flight_data(1.0, 1.0)
+    second = fd.get_closest_flight_data(1.0, 1.0)
+    assert first["airline_logo_path"] == second["airline_logo_path"] == "logos/AB.png"
+    assert logo_manager.calls == 1
+
+
+def test_missing_airline_logo_is_asked_for_again():
+    class LateLogoManager:
+        def __init__(self):
+            self.paths = [None, "logos/AB.png"]
+
+        def resolve_or_fetch_logo(self, provider, airline_iata, airline_icao):
+            return self.paths.pop(0)
+
+    moving = _flight(icao="icao1", altitude=1000, ground_speed=250, heading=20)
+    fd = FlightData(fr_api=FakeApi([moving]), logo_manager=LateLogoManager())
+    assert "airline_logo_path" not in fd.get_closest_flight_data(1.0, 1.0)
+    assert fd.get_closest_flight_data(1.0, 1.0)["airline_logo_path"] == "logos/AB.png"
+
+
+def test_debug_dumps_skipped_when_no_handler_accepts_debug():
+    handler = logging.StreamHandler()
+    saved = (LOGGER.level, LOGGER.propagate, list(LOGGER.handlers))
+    try:
+        LOGGER.setLevel(logging.DEBUG)
+        LOGGER.propagate = False
+        LOGGER.handlers = [handler]
+        handler.setLevel(logging.WARNING)
+        assert _debug_output_enabled() is False
+        handler.setLevel(logging.DEBUG)
+        assert _debug_output_enabled() is True
+    finally:
+        LOGGER.setLevel(saved[0])
+        LOGGER.propagate = saved[1]
+        LOGGER.handlers = saved[2]
+
+
+def test_haversine_array_broadcasts_pairwise_distances():
+    observers = np.radians([[51.47, -0.45], [40.64, -73.78]])
+    points = np.radians([[52.31, 4.76], [48.35, 11.78], [35.55, 139.78]])
+    pairwise = haversine_km_array(observers[:, :1], observers[:, 1:], points[:, 0], points[:, 1])
+    assert pairwise.shape == (2, 3)
+    expected = haversine_km(40.64, -73.78, 48.35, 11.78)
+    assert abs(pairwise[1, 1] - expected) < 1e-6
+
+
+def test_flight_details_reused_for_same_aircraft_within_ttl():
+    now = {"t": 0.0}
+    moving = _flight(icao="icao1", altitude=1000, ground_speed=250, heading=20)
+    api = FakeApi([moving])
+    fd = FlightData(fr_api=api, clock_fn=lambda: now["t"])
+    first = fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    moving.altitude = 1500
+    now["t"] = 10.0
+    second = fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    assert api.detail_calls == ["icao1"]
+    assert first["destination"] == second["destination"] == "BBB"
+    assert second["altitude"] == 1500
+
+    now["t"] = 70.0
+    fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    assert len(api.detail_calls) == 2
+
+
+def test_concurrent_flight_searches_share_one_upstream_request():
+    release = threading.Event()
+
+    class SlowApi(FakeApi):
+        def get_flights(self, bounds=None):
+            flights = super().get_flights(bounds)
+            release.wait(timeout=2)
+            return flights
+
+    api = SlowApi([_flight(icao="icao1", altitude=1000, ground_speed=250, heading=20)])
+    provider = FlightRadarProvider(fr_api=api)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(provider.get_flights_near(1.0, 1.0))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert api.flight_calls == 1
+    assert len(results) == 2 and results[0] is results[1]
+    assert provider.get_flights_near(1.0, 1.0) is results[0]
+    assert api.flight_calls == 2
+
+
+def test_early_repoll_reuses_recent_flight_search():
+    now = {"t": 0.0}
+    api = FakeApi([_flight(icao="icao1", altitude=1000, ground_speed=250, heading=20)])
+    fd = FlightData(fr_api=api, clock_fn=lambda: now["t"])
+    fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    now["t"] = 2.0
+    fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    assert api.flight_calls == 1
+
+    now["t"] = 60.0
+    fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    assert api.flight_calls == 2
+
+
+def test_slow_flight_search_is_not_reused_by_next_scheduled_poll():
+    now = {"t": 0.0}
+
+    class SlowApi(FakeApi):
+        def get_flights(self, bounds=None):
+            now["t"] += 1.5
+            return super().get_flights(bounds)
+
+    api = SlowApi([_flight(icao="icao1", altitude=1000, ground_speed=250, heading=20)])
+    fd = FlightData(fr_api=api, clock_fn=lambda: now["t"])
+    for poll_start in (0.0, 60.0, 120.0, 180.0):
+        now["t"] = poll_start
+        fd.get_closest_flight_data(1.0, 1.0, save_logo=False)
+    assert api.flight_calls == 4
+
+
+def test_runner_up_details_are_prefetched_with_closest():
+    near = _flight(icao="near", altitude=1000, ground_speed=250, heading=20, lat=1.01)
+    mid = _flight(icao="mid", altitude=1000, ground_speed=250, heading=20, lat=1.05)
+    far = _flight(icao="far", altitude=1000, ground_speed=250, heading=20, lat=1.2)
+    api = FakeApi([far, mid, near])
+    now = {"t": 0.0}
+    fd = FlightData(fr_api=api, clock_fn=lambda: now["t"])
+    assert fd.get_closest_flight_data(1.0, 1.0, save_logo=False)["icao24"] == "near"
+    assert sorted(api.detail_calls) == ["far", "mid", "near"]
+
+    api._flights = [far, mid]
+    now["t"] = 59.0
+    assert fd.get_closest_flight_data(1.0, 1.0, save_logo=False)["icao24"] == "mid"
+    assert len(api.detail_calls) == 3
+
+
+def test_logo_fast_resize_setting_reaches_logo_manager(tmp_path):
+    fd = FlightData(save_logo_dir=str(tmp_path), fr_api=FakeApi([]), logo_fast_resize=True)
+    assert fd.logo_manager.fast_resize is True
+    assert FlightData(save_logo_dir=str(tmp_path), fr_api=FakeApi([])).logo_manager.fast_resize is False
@@ -0,0 +1,79 @@
+import os
+
+from PIL import Image
+
+from pixoo_radar.render.common import ROUTE_END, ROUTE_START, TOTAL_FRAMES
+from pixoo_radar.render.flight_view import build_and_send_animation, load_logo_rgba
+from pixoo_radar.settings import AppSettings
+from tests.render_recorder import RecordingPizzoo
+
+
+def _settings():
+    return AppSettings(
+        pixoo_ip="127.0.0.1",
+        pixoo_port=80,
+        pixoo_reconnect_seconds=1,
+        font_name="splitflap",
+        font_path="./fonts/splitflap.bdf",
+        runway_label_font_name="splitflap",
+        runway_label_font_path="./fonts/splitflap.bdf",
+        animation_frame_speed=300,
+        color_box="#454545",
+        color_text="#FFFF00",
+        data_refresh_seconds=60,
+        flight_search_radius_meters=50000,
+        flight_speed_unit="mph",
+        latitude=0,
+        longitude=0,
+        log_level="INFO",
+        log_verbose_events=True,
+        logo_dir="airline_logos",
+        runway_heading_deg=110,
+        weather_refresh_seconds=900,
+        weather_view_seconds=10,
+        weather_wind_speed_unit="mph",
+    )
+
+
+def _payload():
+    return {
+        "icao24": "abc123",
+        "callsign": "AB123",
+        "origin": "AAA",
+        "destination": "BBB",
+        "airline": "Air",
+        "registration": "N1",
+        "altitude": 12000,
+        "ground_speed": 250,
+        "heading": 90,
+    }
+
+
+def test_animation_frames_only_differ_in_route_band():
+    recorder = RecordingPizzoo()
+    build_and_send_animation(recorder, _settings(), _payload())
+
+    ops = [op["op"] for op in recorder.ops]
+    assert ops.count("add_frame") == TOTAL_FRAMES - 1
+    assert ops[-1] == "render"
+
+    frames = recorder.frames[-TOTAL_FRAMES:]
+    first, second = frames[0], frames[1]
+    changed = {(i // 3) for i in range(len(first)) if first[i] != second[i]}
+    assert changed
+    for pixel in changed:
+        x, y = pixel % 64, pixel // 64
+        assert ROUTE_START <= x < ROUTE_END
+        assert 24 <= y <= 28
+
+
+def test_fitted_logo_is_reused_until_the_file_changes(tmp_path):
+    logo_path = str(tmp_path / "AB.png")
+    Image.new("RGB", (80, 30), (200, 10, 10)).save(logo_path)
+    first = load_logo_rgba(logo_path)
+    assert load_logo_rgba(logo_path) is first
+    assert not first.flags.writeable
+
+    Image.new("RGB", (80, 30), (10, 200, 10)).save(logo_path)
+    os.utime(logo_path, ns=(0, os.stat(logo_path).st_mtime_ns + 1))
+    assert tuple(load_logo_rgba(logo_path)[0, 0, :3]) == (10, 200, 10)
@@ -0,0 +1,104 @@
+import numpy as np
+from PIL import Image
+
+from pixoo_radar.render.common import draw_airplane_icon, draw_line, dump_render_debug_gif, line_points
+from pixoo_radar.render.framebuffer import Framebuffer, hex_to_rgb, to_rgb
+from tests.render_recorder import RecordingPizzoo
+
+
+def test_fill_rect_clips_to_display_bounds():
+    fb = Framebuffer()
+    fb.fill_rect(60, -2, 10, 4, "#FF0000")
+    assert tuple(fb.arr[0, 63]) == (255, 0, 0)
+    assert tuple(fb.arr[1, 60]) == (255, 0, 0)
+    assert tuple(fb.arr[2, 60]) == (0, 0, 0)
+    assert tuple(fb.arr[0, 59]) == (0, 0, 0)
+
+
+def test_airplane_icon_respects_clip_window():
+    fb = Framebuffer()
+    draw_airplane_icon(fb, 18, 24, clip_left=21, clip_right=43, color="#FFFFFF")
+    lit = {(int(x), int(y)) for y, x in zip(*fb.arr.any(axis=2).nonzero(), strict=True)}
+    assert lit == {(21, 26), (22, 26)}
+
+
+def test_push_sends_flat_rgb_frame():
+    recorder = RecordingPizzoo()
+    fb = Framebuffer("#10243F")
+    fb.push(recorder)
+    assert len(recorder.frames[-1]) == 64 * 64 * 3
+    assert recorder.frame_colors() == {"#10243F"}
+    assert hex_to_rgb("#10243F") == (16, 36, 63)
+
+
+def test_thick_line_stamps_square_and_clips_at_edges():
+    fb = Framebuffer()
+    draw_line(fb, 0, 0, 3, 0, color="#FFFFFF", thickness=3)
+    lit = {(int(x), int(y)) for y, x in zip(*fb.arr.any(axis=2).nonzero(), strict=True)}
+    assert lit == {(x, y) for x in range(0, 5) for y in range(0, 2)}
+
+
+def test_line_points_match_bresenham_endpoints():
+    xs, ys = line_points(2, 3, 9, 5)
+    assert (int(xs[0]), int(ys[0])) == (2, 3)
+    assert (int(xs[-1]), int(ys[-1])) == (9, 5)
+    assert len(xs) == 8
+
+
+def test_blit_rgba_skips_transparent_pixels():
+    fb = Framebuffer("#000080")
+    rgba = np.zeros((2, 2, 4), dtype=np.uint8)
+    rgba[0, 0] = (255, 0, 0, 255)
+    rgba[1, 1] = (0, 255, 0, 0)
+    fb.blit_rgba(62, 0, rgba)
+    assert tuple(fb.arr[0, 62]) == (255, 0, 0)
+    assert tuple(fb.arr[1, 63]) == (0, 0, 128)
+
+
+def test_debug_gif_round_trips_every_frame(tmp_path):
+    frames = [Framebuffer("#10243F"), Framebuffer("#10243F")]
+    draw_airplane_icon(frames[1], 30, 20, color="#FFFFFF")
+
+    class BufferedPizzoo:
+        size = 64
+
+        def __init__(self):
+            self._Pizzoo__buffer = [fb.arr.reshape(-1).tolist() for fb in frames]
+
+    output_path = tmp_path / "render.gif"
+    assert dump_render_debug_gif(BufferedPizzoo(), 300, output_path=output_path)
+    with Image.open(output_path) as gif:
+        assert gif.n_frames == 2
+        for idx, fb in enumerate(frames):
+            gif.seek(idx)
+            assert np.array_equal(np.asarray(gif.convert("RGB")), fb.arr)
+
+
+def test_debug_gif_quantizes_per_frame_beyond_256_colors(tmp_path):
+    frames = [Framebuffer(), Framebuffer()]
+    for red, fb in enumerate(frames):
+        fb.arr[..., 0] = red * 255
+        fb.arr[..., 1] = (np.arange(64 * 64) % 200).reshape(64, 64)
+
+    class BufferedPizzoo:
+        size = 64
+
+        def __init__(self):
+            self._Pizzoo__buffer = [fb.arr.reshape(-1).tolist() for fb in frames]
+
+    output_path = tmp_path / "render.gif"
+    assert dump_render_debug_gif(BufferedPizzoo(), 300, output_path=output_path)
+    with Image.open(output_path) as gif:
+        for idx, fb in enumerate(frames):
+            gif.seek(idx)
+            assert np.array_equal(np.asarray(gif.convert("RGB")), fb.arr)
+
+
+def test_colors_accept_pizzoo_palette_and_tuple_string_forms():
+    from pizzoo._utils import PICO_PALETTE
+
+    assert to_rgb("(1, 2, 3)") == (1, 2, 3)
+    assert to_rgb("5") == to_rgb(5) == tuple(PICO_PALETTE[5])
+    fb = Framebuffer()
+    fb.fill_rect(0, 0, 1, 1, "(16,36,63)")
+    assert tuple(fb.arr[0, 0]) == (16, 36, 63)
@@ -0,0 +1,96 @@
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from pixoo_radar.flight import logos
+from pixoo_radar.flight.logos import NO_LOGO_TTL_SECONDS, LogoManager
+
+
+class StaticLogoProvider:
+    """Logo provider stand-in returning fixed bytes and counting calls per instance."""
+
+    def __init__(self, logo=None):
+        self._logo = logo
+        self.calls = 0
+
+    def get_airline_logo(self, airline_iata, airline_icao):
+        self.calls += 1
+        return self._logo
+
+
+def _png_bytes(image) -> bytes:
+    buf = BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_flat_logo_skips_sharpening():
+    src = Image.new("RGBA", (128, 40), (0, 0, 0, 255))
+    src.paste((255, 255, 255, 255), (0, 0, 64, 40))
+    logo_bytes = _png_bytes(src)
+    sharpened, ext = LogoManager._resize_logo_bytes(logo_bytes, bg=(0, 0, 0, 255))
+    unsharpened, _ = LogoManager._resize_logo_bytes(logo_bytes, bg=(0, 0, 0, 255), sharpen=False)
+    assert ext == "png"
+    assert np.array_equal(np.asarray(Image.open(BytesIO(sharpened))), np.asarray(Image.open(BytesIO(unsharpened))))
+
+
+def test_identical_logo_bytes_are_resized_once(tmp_path, monkeypatch):
+    resizes = []
+
+    def fake_resize(logo_bytes, **_kwargs):
+        resizes.append(logo_bytes)
+        return b"resized", "png"
+
+    provider = StaticLogoProvider((b"shared-artwork", "png"))
+    monkeypatch.setattr(LogoManager, "_resize_logo_bytes", staticmethod(fake_resize))
+    first = LogoManager(save_logo_dir=tmp_path).resolve_or_fetch_logo(provider, "AB", None)
+    second = LogoManager(save_logo_dir=tmp_path).resolve_or_fetch_logo(provider, "CD", None)
+    assert first.endswith("AB.png") and second.endswith("CD.png")
+    assert (tmp_path / "CD.png").read_bytes() == b"resized"
+    assert resizes == [b"shared-artwork"]
+
+
+def test_resized_logo_hash_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(logos, "LOGO_HASH_CACHE_MAX_FILES", 2)
+    monkeypatch.setattr(LogoManager, "_resize_logo_bytes", staticmethod(lambda logo_bytes, **_kwargs: (logo_bytes, "png")))
+    manager = LogoManager(save_logo_dir=tmp_path)
+    for code in ("AB", "CD", "EF"):
+        manager.resolve_or_fetch_logo(StaticLogoProvider((code.encode(), "png")), code, None)
+    assert len(list((tmp_path / ".by_hash").iterdir())) == 2
+
+
+def test_missing_logo_is_not_refetched_within_ttl(tmp_path):
+    now = {"t": 1000.0}
+    provider = StaticLogoProvider(None)
+    assert LogoManager(tmp_path, clock_fn=lambda: now["t"]).resolve_or_fetch_logo(provider, "ZZ", None) is None
+    restarted = LogoManager(tmp_path, clock_fn=lambda: now["t"])
+    assert restarted.resolve_or_fetch_logo(provider, "ZZ", None) is None
+    assert provider.calls == 1
+
+    now["t"] += NO_LOGO_TTL_SECONDS
+    assert restarted.resolve_or_fetch_logo(provider, "ZZ", None) is None
+    assert provider.calls == 2
+
+
+def test_fast_logo_resize_writes_palette_png(tmp_path):
+    src = Image.new("RGBA", (256, 80), (0, 0, 0, 0))
+    src.paste((200, 20, 20, 255), (0, 0, 128, 80))
+    provider = StaticLogoProvider((_png_bytes(src), "png"))
+
+    path = LogoManager(tmp_path, bg_color=(186, 186, 186, 255), fast_resize=True).resolve_or_fetch_logo(
+        provider, "AB", None
+    )
+    with Image.open(path) as logo:
+        assert logo.mode == "P"
+        assert logo.size == (64, 20)
+        assert logo.convert("RGBA").getpixel((10, 10)) == (200, 20, 20, 255)
+
+
+def test_saved_logos_are_found_without_provider_call(tmp_path):
+    (tmp_path / "AB.png").write_bytes(b"png")
+    provider = StaticLogoProvider()
+
+    manager = LogoManager(tmp_path)
+    assert manager.resolve_or_fetch_logo(provider, "AB", "ABC") == str(tmp_path / "AB.png")
+    assert provider.calls == 0
@@ -56,3 +56,22 @@ def test_primary_font_failure_has_diagnostic_message():
     broken.load_font = lambda _name, _path: (_ for _ in ()).throw(ValueError("bad font"))
     with pytest.raises(RuntimeError, match="Failed to load primary font 'main'"):
         client._load_fonts(broken)
+
+
+def test_connect_with_retry_backs_off_exponentially(monkeypatch):
+    waits = []
+
+    class Connected(Exception):
+        pass
+
+    def fake_sleep(seconds):
+        waits.append(seconds)
+        if len(waits) == 8:
+            raise Connected
+
+    monkeypatch.setattr("pixoo_radar.services.pixoo_client.Pizzoo", lambda *_a, **_k: (_ for _ in ()).throw(OSError("down")))
+    monkeypatch.setattr("pixoo_radar.services.pixoo_client.sleep", fake_sleep)
+    monkeypatch.setattr("pixoo_radar.services.pixoo_client.random.uniform", lambda _lo, _hi: 0.0)
+    with pytest.raises(Connected):
+        PixooClient(_settings()).connect_with_retry()
+    assert waits == [1, 2, 4, 8, 16, 32, 60, 60]
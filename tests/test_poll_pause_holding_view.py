@@ -45,6 +45,8 @@ def test_poll_pause_screen_random_origin_keeps_text_within_display(monkeypatch):
 
     text_ops = [op for op in recorder.ops if op.get("op") == "draw_text"]
     assert len(text_ops) == 4
+    assert [op["op"] for op in recorder.ops][0] == "cls"
+    assert not [op for op in recorder.ops if op.get("op") == "draw_rectangle"]
     assert randint_calls[0][0] == 0
     assert randint_calls[1][0] == 0
     for op in text_ops:
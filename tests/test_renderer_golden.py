@@ -2,9 +2,11 @@ import hashlib
 import json
 from pathlib import Path
 
+import pytest
+
 from pixoo_radar.render.weather_view import draw_runway_wind_diagram, draw_weather_summary_frame
 from pixoo_radar.settings import AppSettings
-from tests.render_recorder import RecordingPizzoo
+from tests.render_recorder import RecordingPizzoo, rendering_pizzoo
 
 GOLDEN_DIR = Path(__file__).parent / "golden"
 
@@ -36,11 +38,6 @@ def _settings():
     )
 
 
-def _ops_sha256(ops) -> str:
-    payload = json.dumps(ops, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
-
 def test_weather_summary_frame_snapshot():
     recorder = RecordingPizzoo()
     draw_weather_summary_frame(
@@ -60,14 +57,21 @@ def test_weather_summary_frame_snapshot():
     assert recorder.ops == expected
 
 
-def test_runway_diagram_snapshot_hash():
-    recorder = RecordingPizzoo()
+def _runway_diagram_goldens():
+    lines = (GOLDEN_DIR / "runway_diagram.sha256").read_text(encoding="utf-8").splitlines()
+    return [tuple(line.split()) for line in lines if line and not line.startswith("#")]
+
+
+@pytest.mark.parametrize(("runway_heading", "wind_dir", "expected_hash"), _runway_diagram_goldens())
+def test_runway_diagram_snapshot_hash(runway_heading, wind_dir, expected_hash):
+    settings = _settings()
+    pizzoo = rendering_pizzoo(settings)
     draw_runway_wind_diagram(
-        recorder,
-        _settings(),
-        wind_dir_deg=90.0,
-        runway_heading_deg=110.0,
+        pizzoo,
+        settings,
+        wind_dir_deg=float(wind_dir),
+        runway_heading_deg=float(runway_heading),
     )
 
-    expected_hash = (GOLDEN_DIR / "runway_diagram.sha256").read_text(encoding="utf-8").strip()
-    assert _ops_sha256(recorder.ops) == expected_hash
+    # Hash of the composited frame (lines and text), so draw order is covered too.
+    assert hashlib.sha256(bytes(pizzoo.get_current_frame())).hexdigest() == expected_hash
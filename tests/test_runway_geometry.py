@@ -1,3 +1,6 @@
+from math import cos, radians, sin
+
+from pixoo_radar.render.common import bearing_to_xy
 from pixoo_radar.render.weather_view import (
     choose_runway_label_position,
     nearest_drawn_tick_bearing,
@@ -22,3 +25,10 @@ def test_choose_runway_label_position_stays_on_screen():
 def test_nearest_drawn_tick_bearing_rounds_to_nearest_10_deg():
     assert nearest_drawn_tick_bearing(123) == 120
     assert nearest_drawn_tick_bearing(127) == 130
+
+
+def test_bearing_to_xy_table_matches_trig_for_whole_and_fractional_degrees():
+    for bearing in (0, 37, 110.0, 359, 402, 12.5, -1e-20):
+        rad = radians(bearing)
+        expected = (int(round(32 + 20 * sin(rad))), int(round(32 - 20 * cos(rad))))
+        assert bearing_to_xy(32, 32, bearing, 20) == expected
@@ -1,4 +1,5 @@
-from time import monotonic
+import json
+from time import monotonic, sleep
 
 from weather_data import WeatherData
 
@@ -45,3 +46,64 @@ def test_weather_seconds_until_refresh_reports_countdown():
 
     wx._cache_at = monotonic() - 901
     assert wx.seconds_until_refresh() == 0
+
+
+def test_startup_serves_saved_snapshot_without_fetching(tmp_path):
+    snapshot_path = tmp_path / "weather.json"
+    provider = Provider()
+    WeatherData(latitude=1.0, longitude=1.0, provider=provider, snapshot_path=snapshot_path).get_current()
+    assert snapshot_path.exists()
+
+    def offline(_lat, _lon):
+        raise OSError("offline")
+
+    wx = WeatherData(latitude=1.0, longitude=1.0, provider=offline, snapshot_path=snapshot_path)
+    assert wx.validate_startup_sources() == "snapshot"
+    assert 890 <= wx.seconds_until_refresh() <= 900
+    payload, refreshed = wx.get_current()
+    assert refreshed is False
+    assert payload["condition"] == "CLEAR"
+
+
+def test_old_startup_snapshot_is_due_for_refresh(tmp_path):
+    snapshot_path = tmp_path / "weather.json"
+    WeatherData(latitude=1.0, longitude=1.0, provider=Provider(), snapshot_path=snapshot_path).get_current()
+    record = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    record["saved_at"] -= 3600
+    snapshot_path.write_text(json.dumps(record), encoding="utf-8")
+
+    wx = WeatherData(latitude=1.0, longitude=1.0, provider=Provider(), snapshot_path=snapshot_path)
+    assert wx.validate_startup_sources() == "snapshot"
+    assert wx.seconds_until_refresh() == 0
+
+
+def test_startup_ignores_snapshot_for_other_location(tmp_path):
+    snapshot_path = tmp_path / "weather.json"
+    WeatherData(latitude=1.0, longitude=1.0, provider=Provider(), snapshot_path=snapshot_path).get_current()
+
+    provider = Provider()
+    wx = WeatherData(latitude=2.0, longitude=2.0, provider=provider, snapshot_path=snapshot_path)
+    assert wx.validate_startup_sources() == "api"
+    assert provider.calls == 1
+
+
+def test_stale_weather_served_while_refreshing_in_background():
+    provider = Provider()
+    wx = WeatherData(
+        latitude=1.0, longitude=1.0, refresh_seconds=900, provider=provider, stale_while_revalidate_seconds=300
+    )
+    first, _ = wx.get_current()
+    wx._cache_at = monotonic() - 901
+
+    stale, refreshed = wx.get_current()
+    assert stale is first
+    assert refreshed is False
+    deadline = monotonic() + 2
+    while wx._revalidating and monotonic() < deadline:
+        sleep(0.01)
+    assert provider.calls == 2
+
+    _, refreshed = wx.get_current()
+    assert refreshed is True
+    _, refreshed = wx.get_current()
+    assert refreshed is False
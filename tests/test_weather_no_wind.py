@@ -123,7 +123,7 @@ def test_runway_diagram_omits_wind_and_active_runway_arrows_when_wind_direction_
         wind_dir_deg=None,
         runway_heading_deg=110.0,
     )
-    colors = [op.get("color") for op in recorder.ops if op.get("op") == "draw_rectangle"]
+    colors = recorder.frame_colors()
     assert COLOR_WIND_ARROW not in colors
     assert COLOR_ACTIVE_RWY_ARROW not in colors
 
@@ -138,16 +138,9 @@ def test_runway_diagram_highlights_variable_wind_ticks_when_range_available():
         wind_dir_from=120,
         wind_dir_to=180,
     )
-    orange_ticks = [
-        op for op in recorder.ops
-        if op.get("op") == "draw_rectangle" and op.get("color") == COLOR_WIND_ARROW and op.get("width") == 1 and op.get("height") == 1
-    ]
-    sector_ticks = [
-        op for op in recorder.ops
-        if op.get("op") == "draw_rectangle" and op.get("color") == COLOR_WIND_SECTOR and op.get("width") == 1 and op.get("height") == 1
-    ]
-    assert orange_ticks
-    assert sector_ticks
+    colors = recorder.frame_colors()
+    assert COLOR_WIND_ARROW in colors
+    assert COLOR_WIND_SECTOR in colors
 
 
 def test_weather_idle_screen_skips_runway_frame_when_wind_direction_missing(monkeypatch):
@@ -1,9 +1,11 @@
 import sys
+import threading
 import types
 from datetime import datetime, timezone
 
 import pytest
 
+from pixoo_radar.flight import metar
 from weather_data import WeatherData
 
 
@@ -172,3 +174,44 @@ def test_weather_startup_validation_fails_when_required_metar_missing():
     )
     with pytest.raises(RuntimeError, match="no METAR raw data returned"):
         wx.validate_startup_sources(require_metar=True)
+
+
+def test_metar_report_is_reused_within_ttl(monkeypatch):
+    calls = []
+
+    class FakeSession:
+        def get(self, url, timeout):
+            calls.append(url)
+            return types.SimpleNamespace(status_code=200, text="2024/01/01 12:00\nLCPH 011200Z 09010KT CAVOK 20/10 Q1015\n")
+
+    monkeypatch.setattr(metar, "_http_session", lambda: FakeSession())
+    monkeypatch.setattr(metar, "_METAR_CACHE", {})
+    first = metar.fetch_metar_report("lcph")
+    second = metar.fetch_metar_report("LCPH")
+    assert first == second
+    assert first["raw"].startswith("LCPH 011200Z")
+    assert len(calls) == 1
+
+
+def test_metar_and_open_meteo_fetches_overlap():
+    both_started = threading.Barrier(2, timeout=2)
+
+    def open_meteo_provider(_lat, _lon):
+        both_started.wait()
+        return {"condition": "CLEAR"}
+
+    def metar_fetcher(_icao):
+        both_started.wait()
+        return {"raw": "LCPH 170850Z 27012KT 9999 FEW020 20/10 Q1016"}
+
+    wx = WeatherData(
+        latitude=34.0,
+        longitude=32.0,
+        metar_icao="LCPH",
+        provider=open_meteo_provider,
+        metar_fetcher=metar_fetcher,
+        timezone_name="UTC",
+    )
+    raw = wx._fetch_raw()
+    assert raw["open_meteo"] == {"condition": "CLEAR"}
+    assert raw["metar"]["raw"].startswith("LCPH")
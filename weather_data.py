@@ -1,10 +1,15 @@
 """Weather data provider for idle display mode (METAR + Open-Meteo)."""
 
+import json
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from math import ceil, exp
-from time import monotonic
+from pathlib import Path
+from time import monotonic, time
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from pixoo_radar.flight.metar import fetch_metar_report
@@ -13,6 +18,7 @@ from pixoo_radar.flight.metar import fetch_metar_report
 LOGGER = logging.getLogger("pixoo_radar.weather")
 WIND_VARIATION_RE = re.compile(r"\b(\d{3})V(\d{3})\b")
 METAR_TIME_RE = re.compile(r"\b(\d{2})(\d{2})(\d{2})Z\b")
+WEATHER_SNAPSHOT_MAX_AGE_SECONDS = 24 * 60 * 60
 
 
 class WeatherData:
@@ -63,6 +69,8 @@ class WeatherData:
         timezone_name: str | None = None,
         iata_mapper=None,
         utc_now_provider=None,
+        snapshot_path: str | Path | None = None,
+        stale_while_revalidate_seconds: int = 0,
     ):
         self.latitude = latitude
         self.longitude = longitude
@@ -83,9 +91,17 @@ class WeatherData:
                 self.longitude,
                 self._local_timezone_name,
             )
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
         self._cache = None
         self._cache_at = 0.0
         self._last_error = None
+        self._metar_executor = None
+        # Past refresh_seconds but within this window, the cached payload is served while a
+        # background thread refreshes it; the next call then reports refreshed=True.
+        self.stale_while_revalidate_seconds = max(0, int(stale_while_revalidate_seconds))
+        self._revalidate_lock = threading.Lock()
+        self._revalidating = False
+        self._revalidated = False
 
     def get_current(self):
         """Return (payload, refreshed) where refreshed indicates provider was queried."""
@@ -94,10 +110,29 @@ class WeatherData:
     def get_current_with_options(self, force_refresh: bool = False):
         """Return (payload, refreshed) with optional forced provider refresh."""
         now = monotonic()
-        if not force_refresh and self._cache and (now - self._cache_at) < self.refresh_seconds:
+        if not force_refresh and self._cache:
+            with self._revalidate_lock:
+                if self._revalidated:
+                    self._revalidated = False
+                    return self._cache, True
+            age = now - self._cache_at
+            if age < self.refresh_seconds:
+                return self._cache, False
+            if age < self.refresh_seconds + self.stale_while_revalidate_seconds:
+                stale = self._cache
+                self._start_revalidation()
+                return stale, False
+
+        if self._refresh(now):
+            return self._cache, True
+
+        if self._cache:
             return self._cache, False
 
-        refreshed = True
+        raise RuntimeError(f"Weather bootstrap failed: {self._last_error or 'no weather payload available'}")
+
+    def _refresh(self, now: float) -> bool:
+        """Fetch and cache a new payload; on failure record the error and keep the old cache."""
         try:
             raw = self._fetch_raw()
             LOGGER.info("Weather API raw payload: %s", raw)
@@ -106,17 +141,31 @@ class WeatherData:
             if payload:
                 self._cache = payload
                 self._cache_at = now
-                return self._cache, refreshed
+                self._save_snapshot(payload)
+                return True
             self._last_error = "Weather provider returned no data"
             LOGGER.warning("Weather provider returned no data payload after normalization.")
         except Exception as exc:  # noqa: BLE001
             self._last_error = f"Weather provider error: {exc}"
             LOGGER.warning("Weather API fetch failed: %s", exc)
-
-        if self._cache:
-            return self._cache, False
-
-        raise RuntimeError(f"Weather bootstrap failed: {self._last_error or 'no weather payload available'}")
+        return False
+
+    def _start_revalidation(self) -> None:
+        with self._revalidate_lock:
+            if self._revalidating:
+                return
+            self._revalidating = True
+        LOGGER.info("Serving cached weather while refreshing in the background.")
+        threading.Thread(target=self._revalidate, name="pixoo-radar-weather-refresh", daemon=True).start()
+
+    def _revalidate(self) -> None:
+        refreshed = False
+        try:
+            refreshed = self._refresh(monotonic())
+        finally:
+            with self._revalidate_lock:
+                self._revalidating = False
+                self._revalidated = self._revalidated or refreshed
 
     def get_last_error(self):
         return self._last_error
@@ -131,7 +180,22 @@ class WeatherData:
             return 0
         return int(ceil(remaining))
 
-    def validate_startup_sources(self, require_metar: bool = False):
+    def validate_startup_sources(self, require_metar: bool = False) -> str:
+        """
+        Prime the cache for startup and return where it came from (`"snapshot"` or `"api"`).
+
+        A recent on-disk snapshot for the same location is served with its
+        original age, so a restart within the refresh interval makes no API
+        call; live sources are only required when no usable snapshot exists.
+        """
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            payload, age = snapshot
+            self._cache = payload
+            self._cache_at = monotonic() - min(age, self.refresh_seconds)
+            self._last_error = None
+            return "snapshot"
+
         raw = self._fetch_raw()
         open_meteo = raw.get("open_meteo")
         condition = open_meteo.get("condition") if isinstance(open_meteo, dict) else None
@@ -156,6 +220,44 @@ class WeatherData:
         self._cache = payload
         self._cache_at = monotonic()
         self._last_error = None
+        self._save_snapshot(payload)
+        return "api"
+
+    def _snapshot_origin(self):
+        return {"latitude": self.latitude, "longitude": self.longitude, "metar_icao": self.metar_icao}
+
+    def _save_snapshot(self, payload) -> None:
+        if self.snapshot_path is None:
+            return
+        record = {"saved_at": time(), "origin": self._snapshot_origin(), "payload": payload}
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(record), encoding="utf-8")
+            os.replace(tmp_path, self.snapshot_path)
+        except (OSError, TypeError, ValueError) as exc:
+            LOGGER.warning("Unable to save weather snapshot to %s: %s", self.snapshot_path, exc)
+
+    def _load_snapshot(self):
+        if self.snapshot_path is None:
+            return None
+        try:
+            record = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable weather snapshot %s: %s", self.snapshot_path, exc)
+            return None
+        if not isinstance(record, dict) or record.get("origin") != self._snapshot_origin():
+            return None
+        try:
+            age = time() - float(record.get("saved_at"))
+        except (TypeError, ValueError):
+            return None
+        payload = record.get("payload")
+        if not (0 <= age < WEATHER_SNAPSHOT_MAX_AGE_SECONDS) or not isinstance(payload, dict) or not payload:
+            return None
+        return payload, age
 
     def _normalize(self, raw):
         if not isinstance(raw, dict):
@@ -247,6 +349,13 @@ class WeatherData:
         provider_error = None
         metar_error = None
 
+        # METAR (NOAA) and Open-Meteo are independent hosts; overlap the two round-trips.
+        metar_future = None
+        if self.metar_icao:
+            if self._metar_executor is None:
+                self._metar_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pixoo-radar-metar")
+            metar_future = self._metar_executor.submit(self.metar_fetcher, self.metar_icao)
+
         try:
             open_meteo_payload = self.provider(self.latitude, self.longitude)
             LOGGER.info("Open-Meteo raw response: %s", open_meteo_payload if open_meteo_payload is not None else "<none>")
@@ -254,9 +363,9 @@ class WeatherData:
             provider_error = str(exc)
             LOGGER.warning("Open-Meteo fetch failed: %s", exc)
 
-        if self.metar_icao:
+        if metar_future is not None:
             try:
-                metar_payload = self.metar_fetcher(self.metar_icao)
+                metar_payload = metar_future.result()
                 LOGGER.info("METAR raw response (%s): %s", self.metar_icao, metar_payload if metar_payload is not None else "<none>")
                 metar_raw = None
                 if isinstance(metar_payload, dict):